@@ -3,145 +3,118 @@
 Example configuration for running Redmine MCP Server directly with Python
 Demonstrates environment setup, client configuration, and server startup
 """
-import os
 import sys
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
+# uvloop is optional (and unavailable on Windows); fall back to stock asyncio
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add the current directory to Python path for imports
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-def setup_environment():
-    """Configure environment variables for Redmine MCP Server"""
-    
-    # Required Redmine configuration
-    os.environ['REDMINE_URL'] = 'https://your-redmine-instance.com'
-    os.environ['REDMINE_API_KEY'] = 'your-api-key-here'
+def _status(*args):
+    """Print a launcher message; stdout is reserved for the stdio transport"""
+    print(*args, file=sys.stderr)
+
+def load_configuration():
+    """
+    Load and validate the server configuration from the environment once
     
-    # Optional server configuration
-    os.environ['MCP_SERVER_MODE'] = 'live'  # Options: live, debug, test
-    os.environ['MCP_LOG_LEVEL'] = 'INFO'    # Options: DEBUG, INFO, WARNING, ERROR
+    Returns:
+        AppConfig instance, or None if required settings are missing or invalid
+    """
+    from src.core.config import AppConfig
     
-    # Optional Redmine connection settings
-    os.environ['REDMINE_TIMEOUT'] = '30'
-    os.environ['REDMINE_MAX_RETRIES'] = '3'
+    try:
+        config = AppConfig.from_environment()
+    except ValueError as e:
+        _status(f"Error: {e}")
+        _status("\nPlease set the following:")
+        _status("  REDMINE_URL=https://your-redmine-instance.com")
+        _status("  REDMINE_API_KEY=your-api-key-here")
+        return None
     
-    print("Environment configured for Redmine MCP Server")
+    _status("Configuration validation passed")
+    return config
 
-def validate_configuration():
-    """Validate that required configuration is present"""
-    required_vars = ['REDMINE_URL', 'REDMINE_API_KEY']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+async def run_server(config=None):
+    """Run the modular Redmine MCP server on the current event loop"""
+    # Imported lazily so the config helpers above stay cheap to import
+    from src.server import RedmineMCPServer
     
-    if missing_vars:
-        print(f"Error: Missing required environment variables: {', '.join(missing_vars)}")
-        print("\nPlease set the following:")
-        for var in missing_vars:
-            if var == 'REDMINE_URL':
-                print(f"  {var}=https://your-redmine-instance.com")
-            elif var == 'REDMINE_API_KEY':
-                print(f"  {var}=your-api-key-here")
-        return False
+    server = RedmineMCPServer()
+    server.initialize(config)
     
-    print("Configuration validation passed")
-    return True
-
-async def run_fastmcp_server():
-    """Run the FastMCP server (recommended approach)"""
-    try:
-        from fastmcp_server import main
-        print("Starting FastMCP server...")
-        await main()
-    except ImportError:
-        print("Error: fastmcp_server.py not found")
-        print("Using fallback to complex server...")
-        await run_complex_server()
-
-async def run_complex_server():
-    """Run the complex server implementation"""
-    try:
-        from src.mcp_server import RedmineMCPServer
-        
-        server = RedmineMCPServer()
-        server.initialize()
-        
-        print("Starting Redmine MCP Server...")
-        await server.run()
-        
-    except Exception as e:
-        print(f"Server startup failed: {e}")
-        raise
+    # initialize() installs its own stderr handler; swap in the queued one
+    setup_logging(server.config.logging.level)
+    
+    _status("Starting Redmine MCP Server...")
+    await server.run_async()
 
-def setup_logging():
+def setup_logging(log_level='INFO'):
     """Configure logging for the MCP server"""
-    log_level = os.getenv('MCP_LOG_LEVEL', 'INFO').upper()
     
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('mcp_server.log')
-        ]
-    )
+    # Loggers only enqueue records; a listener thread does the stream and
+    # file I/O so it never blocks the event loop
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # stdout carries the stdio transport, so logs go to stderr
+    stream_handler = logging.StreamHandler(sys.stderr)
+    file_handler = logging.FileHandler('mcp_server.log', delay=True)
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, log_level))
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
-    print(f"Logging configured at {log_level} level")
+    _status(f"Logging configured at {log_level} level")
 
 async def main():
     """Main entry point for Python MCP server"""
-    print("=== Redmine MCP Server Configuration ===")
-    
-    # Step 1: Setup environment
-    setup_environment()
-    
-    # Step 2: Setup logging
-    setup_logging()
+    _status("=== Redmine MCP Server Configuration ===")
     
-    # Step 3: Validate configuration
-    if not validate_configuration():
+    # Step 1: Load and validate configuration
+    config = load_configuration()
+    if config is None:
         sys.exit(1)
     
-    # Step 4: Choose server implementation
-    server_choice = os.getenv('MCP_SERVER_TYPE', 'fastmcp').lower()
-    
-    if server_choice == 'fastmcp':
-        print("Using FastMCP implementation (recommended)")
-        await run_fastmcp_server()
-    else:
-        print("Using complex server implementation")
-        await run_complex_server()
+    # Step 2: Start the server (it sets up logging once initialized)
+    await run_server(config)
 
 def run_with_container_compatibility():
     """Run server with container environment compatibility"""
     try:
         # Check if there's already a running event loop
         loop = asyncio.get_running_loop()
-        print("Detected existing event loop - using container compatibility mode")
-        
-        # Import nest_asyncio for nested loop support
-        try:
-            import nest_asyncio
-            nest_asyncio.apply()
-            task = loop.create_task(main())
-            return task
-        except ImportError:
-            print("Installing nest_asyncio for container compatibility...")
-            import subprocess
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "nest_asyncio"])
-            import nest_asyncio
-            nest_asyncio.apply()
-            task = loop.create_task(main())
-            return task
-            
     except RuntimeError:
         # No event loop running, we can start our own
-        print("Starting new event loop for MCP server")
+        _status("Starting new event loop for MCP server")
+        if uvloop is not None:
+            return uvloop.run(main())
         return asyncio.run(main())
+    
+    # Schedule on the existing loop; the caller owns it and will drive the task
+    _status("Detected existing event loop - using container compatibility mode")
+    return loop.create_task(main())
 
 if __name__ == "__main__":
-    print("""
+    _status("""
 === Redmine MCP Server Python Configuration ===
 
 Before running, please set your environment variables:
@@ -150,9 +123,8 @@ export REDMINE_URL="https://your-redmine-instance.com"
 export REDMINE_API_KEY="your-api-key-here"
 
 Optional settings:
-export MCP_SERVER_MODE="live"          # live, debug, test
-export MCP_LOG_LEVEL="INFO"            # DEBUG, INFO, WARNING, ERROR
-export MCP_SERVER_TYPE="fastmcp"       # fastmcp, complex
+export SERVER_MODE="live"              # live, debug, test
+export LOG_LEVEL="INFO"                # DEBUG, INFO, WARNING, ERROR
 
 Then run:
 python mcp_config_example.py
@@ -160,15 +132,10 @@ python mcp_config_example.py
 Or use the configuration programmatically in your own script.
     """)
     
-    # Check if environment is configured
-    if not os.getenv('REDMINE_URL') or not os.getenv('REDMINE_API_KEY'):
-        print("Please configure environment variables before running.")
-        sys.exit(1)
-    
     try:
         run_with_container_compatibility()
     except KeyboardInterrupt:
-        print("\nServer stopped by user")
+        _status("\nServer stopped by user")
     except Exception as e:
-        print(f"Server error: {e}")
+        _status(f"Server error: {e}")
         sys.exit(1)
\ No newline at end of file
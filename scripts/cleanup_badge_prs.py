@@ -9,94 +9,269 @@ This script will:
 import subprocess
 import json
 import argparse
+import os
+import re
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def get_open_badge_prs():
-    """Get list of open PRs that are badge updates"""
+# All open PRs with the fields the cleanup needs, 100 per page; gh's
+# --paginate follows pageInfo.endCursor through $endCursor
+OPEN_PRS_QUERY = """
+query($owner: String!, $repo: String!, $endCursor: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(states: OPEN, first: 100, after: $endCursor) {
+      nodes { id number title headRefName author { login } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# PRs closed at once when falling back to one gh subprocess per PR
+MAX_WORKERS = 8
+
+# PRs closed per GraphQL mutation request
+CLOSE_BATCH_SIZE = 50
+
+CLOSE_COMMENT = "Closing outdated badge update PR"
+
+_print_lock = threading.Lock()
+
+def log(message):
+    """Print a line without interleaving output from worker threads"""
+    with _print_lock:
+        print(message, flush=True)
+
+# Badge PR listings are reused for this long by repeated runs (CI loops,
+# a dry run followed by the real one); closing PRs drops the entry
+CACHE_TTL = 60
+CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'rrmcpy', 'badge_prs.json'
+)
+
+def _cache_key():
+    """
+    Identify the repository by the working directory
+    
+    gh resolves {owner}/{repo} from the checkout it runs in, so the cwd
+    names the same repository without starting a subprocess.
+    """
+    return os.path.realpath(os.getcwd())
+
+def _read_cache():
     try:
-        # List all open PRs
-        result = subprocess.run(
-            ["gh", "pr", "list", "--json", "number,title,headRefName,author", "--state", "open"],
-            capture_output=True,
-            text=True,
-            check=True
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def load_cached_prs(key):
+    """Return the cached badge PR list for key, or None if missing or stale"""
+    entry = _read_cache().get(key)
+    if entry and time.time() - entry['ts'] < CACHE_TTL:
+        return entry['prs']
+    return None
+
+def save_cached_prs(key, prs):
+    """Store a badge PR list for key; prs=None removes the entry"""
+    cache = _read_cache()
+    if prs is None:
+        if cache.pop(key, None) is None:
+            return
+    else:
+        cache[key] = {'ts': time.time(), 'prs': prs}
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        # Write then rename so a concurrent run never reads half a file
+        tmp_path = f"{CACHE_PATH}.{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: could not write PR cache: {e}")
+
+# The Actions bot is reported differently by the REST, GraphQL and gh CLI views
+BADGE_BOT_LOGINS = {"github-actions[bot]", "github-actions", "app/github-actions"}
+
+def get_open_badge_prs(cache_key=None):
+    """Get list of open PRs that are badge updates"""
+    if cache_key is not None:
+        cached = load_cached_prs(cache_key)
+        if cached is not None:
+            print("Using cached PR list (--no-cache to refresh)")
+            return cached
+    # One GraphQL query (per 100 PRs) returns every open PR with its
+    # branch name, so closing needs no per-PR lookups. Output is one PR per
+    # line and is filtered as it streams in rather than buffered whole;
+    # stderr goes to a file so it can never fill a pipe and stall gh.
+    with tempfile.TemporaryFile(mode='w+') as stderr:
+        process = subprocess.Popen(
+            ["gh", "api", "graphql", "--paginate",
+             "-F", "owner={owner}", "-F", "repo={repo}",
+             "-f", f"query={OPEN_PRS_QUERY}",
+             "--jq", ".data.repository.pullRequests.nodes[]"],
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True
         )
         
-        prs = json.loads(result.stdout)
         badge_prs = []
+        with process.stdout:
+            for line in process.stdout:
+                pr = json.loads(line)
+                # Check if it's a badge update PR
+                author = (pr.get('author') or {}).get('login')
+                if (pr['title'].lower() == "update test status badge" and
+                    author in BADGE_BOT_LOGINS):
+                    badge_prs.append(pr)
         
-        for pr in prs:
-            # Check if it's a badge update PR
-            if (pr['title'].lower() == "update test status badge" and 
-                pr['author']['login'] == "github-actions[bot]"):
-                badge_prs.append(pr)
-        
-        return badge_prs
-    except subprocess.CalledProcessError as e:
-        print(f"Error getting PRs: {e}")
-        return []
+        if process.wait() != 0:
+            stderr.seek(0)
+            print(f"Error getting PRs: {stderr.read().strip() or f'gh exited with status {process.returncode}'}")
+            return []
+    
+    if cache_key is not None:
+        save_cached_prs(cache_key, badge_prs)
+    return badge_prs
 
-def close_pr(pr_number, delete_branch=True):
-    """Close a PR and optionally delete its branch"""
+def close_pr(pr_number, comment=True):
+    """Close a PR, leaving CLOSE_COMMENT on it unless comment is False"""
     try:
-        print(f"Closing PR #{pr_number}...")
+        log(f"Closing PR #{pr_number}...")
         subprocess.run(
-            ["gh", "pr", "close", str(pr_number), "--comment", "Closing outdated badge update PR"],
-            check=True
+            ["gh", "pr", "close", str(pr_number),
+             *(["--comment", CLOSE_COMMENT] if comment else [])],
+            check=True,
+            capture_output=True,
+            text=True
         )
-        
-        if delete_branch:
-            # Get the branch name
-            result = subprocess.run(
-                ["gh", "pr", "view", str(pr_number), "--json", "headRefName"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            pr_data = json.loads(result.stdout)
-            branch_name = pr_data.get('headRefName')
-            
-            if branch_name:
-                print(f"  Deleting branch: {branch_name}")
-                try:
-                    subprocess.run(
-                        ["git", "push", "origin", "--delete", branch_name],
-                        check=True,
-                        capture_output=True
-                    )
-                except subprocess.CalledProcessError:
-                    print(f"  Failed to delete branch {branch_name} (might be protected or already deleted)")
-        
         return True
     except subprocess.CalledProcessError as e:
-        print(f"  Failed to close PR #{pr_number}: {e}")
+        log(f"  Failed to close PR #{pr_number}: {(e.stderr or '').strip() or e}")
         return False
 
+def _close_batch(prs):
+    """
+    Comment on and close PRs with one aliased GraphQL mutation
+    
+    Returns a list of (commented, closed) boolean pairs, one per PR.
+    """
+    fields = []
+    for i, pr in enumerate(prs):
+        node_id = json.dumps(pr['id'])
+        fields.append(f"c{i}: addComment(input: {{subjectId: {node_id}, "
+                      f"body: {json.dumps(CLOSE_COMMENT)}}}) {{ clientMutationId }}")
+        fields.append(f"p{i}: closePullRequest(input: {{pullRequestId: {node_id}}}) "
+                      f"{{ pullRequest {{ number }} }}")
+    mutation = "mutation {\n  " + "\n  ".join(fields) + "\n}"
+    
+    # gh exits non-zero when any field fails but still prints the response,
+    # which says per alias what succeeded
+    result = subprocess.run(
+        ["gh", "api", "graphql", "-f", f"query={mutation}"],
+        capture_output=True,
+        text=True
+    )
+    try:
+        data = json.loads(result.stdout).get('data') or {}
+    except ValueError:
+        data = {}
+    return [(bool(data.get(f"c{i}")), bool(data.get(f"p{i}"))) for i in range(len(prs))]
+
+def close_prs(prs):
+    """
+    Close PRs, batching them into GraphQL mutations
+    
+    PRs a batch could not close, or that were listed without a node ID,
+    are retried one at a time with gh pr close; the retry only comments
+    on PRs whose comment the batch did not already post.
+    
+    Returns a list of booleans, True for each PR that was closed.
+    """
+    commented = [False] * len(prs)
+    closed = [False] * len(prs)
+    batchable = [i for i, pr in enumerate(prs) if pr.get('id')]
+    for start in range(0, len(batchable), CLOSE_BATCH_SIZE):
+        indexes = batchable[start:start + CLOSE_BATCH_SIZE]
+        log(f"Closing {len(indexes)} PRs in one request...")
+        for i, (comment_ok, close_ok) in zip(indexes, _close_batch([prs[i] for i in indexes])):
+            commented[i] = comment_ok
+            closed[i] = close_ok
+    
+    retry = [i for i, ok in enumerate(closed) if not ok]
+    if retry:
+        # Closures are independent, so run several at once
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = executor.map(
+                lambda i: close_pr(prs[i]['number'], comment=not commented[i]), retry)
+            for i, ok in zip(retry, results):
+                closed[i] = ok
+    return closed
+
+# Refs git push reports it could not delete
+_FAILED_DELETE_RE = re.compile(r"unable to delete '([^']+)'|\[remote rejected\]\s+(\S+)")
+
+def delete_branches(branch_names):
+    """
+    Delete remote branches with a single push
+    
+    Returns the branches that could not be deleted.
+    """
+    if not branch_names:
+        return []
+    print(f"Deleting {len(branch_names)} branches...")
+    # One push (and one connection to the remote) for every branch; git
+    # deletes what it can and reports the rest
+    result = subprocess.run(
+        ["git", "push", "origin", "--delete", *branch_names],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode == 0:
+        return []
+    failed = [a or b for a, b in _FAILED_DELETE_RE.findall(result.stderr)]
+    if not failed:
+        # Nothing per-branch to point at (e.g. authentication); none were deleted
+        print(f"  Failed to delete branches: {result.stderr.strip()}")
+        return list(branch_names)
+    for branch_name in failed:
+        print(f"  Failed to delete branch {branch_name} (might be protected or already deleted)")
+    return failed
+
 def main():
     parser = argparse.ArgumentParser(description="Cleanup unnecessary badge update PRs")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without doing it")
     parser.add_argument("--keep-branches", action="store_true", help="Don't delete branches after closing PRs")
     parser.add_argument("--keep-latest", action="store_true", help="Keep the most recent badge update PR open")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore PR listings cached by runs in the last {CACHE_TTL}s")
     args = parser.parse_args()
     
-    # Check if gh CLI is available
-    try:
-        subprocess.run(["gh", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if gh CLI is available (a PATH lookup; no need to start gh)
+    if shutil.which("gh") is None:
         print("Error: GitHub CLI (gh) is not installed or not in PATH")
         print("Install it from: https://cli.github.com/")
         sys.exit(1)
     
     # Get badge PRs
-    badge_prs = get_open_badge_prs()
+    cache_key = _cache_key()
+    if args.no_cache:
+        save_cached_prs(cache_key, None)
+    badge_prs = get_open_badge_prs(cache_key)
     
     if not badge_prs:
         print("No open badge update PRs found.")
         return
     
-    print(f"Found {len(badge_prs)} open badge update PRs:")
-    for pr in badge_prs:
-        print(f"  PR #{pr['number']}: {pr['title']} (branch: {pr['headRefName']})")
+    # Per-PR listings can run to hundreds of lines; emit them in one write
+    lines = [f"Found {len(badge_prs)} open badge update PRs:"]
+    lines.extend(f"  PR #{pr['number']}: {pr['title']} (branch: {pr['headRefName']})"
+                 for pr in badge_prs)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Sort by PR number (newest last)
     badge_prs.sort(key=lambda x: x['number'])
@@ -113,11 +288,23 @@ def main():
     # Close PRs
     print(f"\n{'[DRY RUN] Would close' if args.dry_run else 'Closing'} {len(badge_prs)} PRs...")
     
-    for pr in badge_prs:
-        if args.dry_run:
-            print(f"[DRY RUN] Would close PR #{pr['number']} and {'keep' if args.keep_branches else 'delete'} branch {pr['headRefName']}")
-        else:
-            close_pr(pr['number'], delete_branch=not args.keep_branches)
+    if args.dry_run:
+        action = 'keep' if args.keep_branches else 'delete'
+        sys.stdout.write("".join(
+            f"[DRY RUN] Would close PR #{pr['number']} and {action} branch {pr['headRefName']}\n"
+            for pr in badge_prs
+        ))
+    else:
+        # The listing is about to go stale
+        save_cached_prs(cache_key, None)
+        results = close_prs(badge_prs)
+        failed = results.count(False)
+        if failed:
+            print(f"\n{failed} of {len(badge_prs)} PRs could not be closed")
+        
+        if not args.keep_branches:
+            delete_branches([pr['headRefName'] for pr, closed in zip(badge_prs, results)
+                             if closed and pr['headRefName']])
     
     print("\nDone!")
 
@@ -6,12 +6,374 @@ import sys
 import json
 import subprocess
 import argparse
+import atexit
+import itertools
 import os
+import selectors
+import tempfile
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _encode = orjson.dumps
+    _decode = orjson.loads
+    
+    def _encode_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    # Compact separators keep request frames small
+    _json_encode = json.JSONEncoder(separators=(',', ':')).encode
+    
+    def _encode(obj):
+        return _json_encode(obj).encode('utf-8')
+    
+    _decode = json.loads
+    
+    def _encode_pretty(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _print_json(obj):
+    """Write obj to stdout as indented JSON"""
+    sys.stdout.buffer.write(_encode_pretty(obj) + b'\n')
+    sys.stdout.buffer.flush()
+
+
+def _tool_result(response):
+    # Successful calls carry "result": a single lookup on that path, with
+    # the error case handled by the exception
+    try:
+        return response["result"]
+    except KeyError:
+        return {"error": response.get("error")}
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROTOCOL_VERSION = "2024-11-05"
+
+# Seconds to wait for any server output before treating it as stalled
+DEFAULT_READ_TIMEOUT = 120.0
+
+# Calls sent together by the CLI's --batch mode; bounds how much one
+# window holds in memory and how many requests are in flight at once
+BATCH_WINDOW = 32
+
+
+class MCPServerProcess:
+    """
+    A long-lived MCP server subprocess speaking JSON-RPC over stdio
+    
+    The server is started and initialized once; every later request reuses
+    the same process, so interpreter start-up and Redmine client set-up are
+    paid a single time rather than per tool call.
+    """
+    
+    def __init__(self, command=None, cwd=None, read_timeout=DEFAULT_READ_TIMEOUT):
+        """
+        Args:
+            command: Server command line (defaults to src/server.py)
+            cwd: Working directory for the server (defaults to the project root)
+            read_timeout: Seconds to wait for server output before raising
+                TimeoutError; None waits indefinitely
+        """
+        self.command = command or [sys.executable, 'src/server.py']
+        self.cwd = cwd or PROJECT_ROOT
+        self.read_timeout = read_timeout
+        self.process = None
+        self._stdout = None
+        self._selector = None
+        self._buffer = bytearray()
+        self._outgoing = bytearray()
+        self._stderr_file = None
+        # Server log captured when a dead process was discarded
+        self._exit_stderr = ''
+        self._next_id = 0
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Spawn the server and complete the MCP initialize handshake"""
+        if self.process is not None:
+            return
+        
+        # stderr goes to a temporary file so server logging can never fill a
+        # pipe and stall the stdout reader; it is only read when the server dies.
+        # Pipes stay binary so no text codec layer sits in the way.
+        self._stderr_file = tempfile.TemporaryFile()
+        # bufsize=0 leaves both pipes unbuffered: frames go out with no
+        # flush, and both pipes are driven through a selector so a hung
+        # server surfaces as a timeout instead of a blocked read or write
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr_file,
+            cwd=self.cwd,
+            bufsize=0
+        )
+        self._stdout = self.process.stdout
+        self._buffer.clear()
+        self._outgoing.clear()
+        # stdin never blocks: a server that stops reading while its own
+        # stdout is full must not wedge the client mid-write
+        os.set_blocking(self.process.stdin.fileno(), False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._stdout, selectors.EVENT_READ)
+        self._exit_stderr = ''
+        
+        try:
+            response = self._request_locked("initialize", {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "rrmcpy-mcp-client", "version": "1.0"}
+            })
+            if "error" in response:
+                raise RuntimeError(f"MCP initialize failed: {response['error']}")
+            self._write({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        except BaseException:
+            # A half-started server is never reused; the next call retries
+            self._discard()
+            raise
+    
+    def request(self, method, params=None):
+        """
+        Send a JSON-RPC request and wait for its response
+        
+        Args:
+            method: JSON-RPC method name
+            params: Optional method parameters
+            
+        Returns:
+            The full JSON-RPC response message
+        """
+        with self._lock:
+            self._ensure_started()
+            try:
+                return self._request_locked(method, params)
+            except TimeoutError:
+                # A slow server is left running; late replies are skipped by id
+                raise
+            except (EOFError, OSError):
+                self._discard()
+                raise
+    
+    def call_tool(self, tool_name, arguments=None):
+        """
+        Call an MCP tool
+        
+        Args:
+            tool_name: Name of the MCP tool to call (e.g., "redmine-health-check")
+            arguments: Optional dictionary of tool arguments
+            
+        Returns:
+            The tool result, or a dictionary with an "error" key
+        """
+        try:
+            response = self.request("tools/call", {
+                "name": tool_name,
+                "arguments": arguments or {}
+            })
+        except TimeoutError as e:
+            return {'error': str(e)}
+        except (EOFError, OSError):
+            return {'error': 'Server error', 'stderr': self.read_stderr()}
+        return _tool_result(response)
+    
+    def call_tools(self, calls):
+        """
+        Call several MCP tools in one pipelined round trip
+        
+        Requests are sent without waiting for earlier responses, so the
+        calls overlap on the server instead of each waiting for the
+        previous one.
+        
+        Args:
+            calls: List of (tool_name, arguments) pairs
+            
+        Returns:
+            List of tool results (or error dictionaries), in the order of calls
+        """
+        if not calls:
+            return []
+        with self._lock:
+            try:
+                self._ensure_started()
+                responses = self._request_many_locked([
+                    ("tools/call", {"name": tool_name, "arguments": arguments or {}})
+                    for tool_name, arguments in calls
+                ])
+            except TimeoutError as e:
+                return [{'error': str(e)}] * len(calls)
+            except (EOFError, OSError):
+                self._discard()
+                return [{'error': 'Server error', 'stderr': self.read_stderr()}] * len(calls)
+        return [_tool_result(response) for response in responses]
+    
+    def read_stderr(self):
+        """Return everything the server has logged so far"""
+        if self._stderr_file is None:
+            return self._exit_stderr
+        self._stderr_file.seek(0)
+        return self._stderr_file.read().decode('utf-8', 'replace')
+    
+    def close(self):
+        """Stop the server by closing its input and wait for it to exit"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        finally:
+            self._selector.close()
+            self._stdout.close()
+            self._stderr_file.close()
+            self._stderr_file = None
+            self.process = None
+    
+    def _ensure_started(self):
+        # A server that has exited is closed and replaced rather than
+        # handed a request it can never answer
+        if self.process is not None and self.process.poll() is not None:
+            self._discard()
+        if self.process is None:
+            self.start()
+    
+    def _discard(self):
+        # Close a dead or broken server, keeping its log for read_stderr
+        exit_stderr = self.read_stderr()
+        self.close()
+        self._exit_stderr = exit_stderr
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+    
+    def _queue(self, *messages):
+        # One newline-terminated frame per message. MCP's stdio transport is
+        # defined as newline-delimited JSON (messages never contain raw
+        # newlines), so the server cannot accept length-prefixed frames.
+        # Frames are sent by _pump as the pipe accepts them.
+        if not self._outgoing:
+            self._selector.register(self.process.stdin, selectors.EVENT_WRITE)
+        for message in messages:
+            self._outgoing += _encode(message)
+            self._outgoing += b'\n'
+    
+    def _write(self, *messages):
+        # Send messages that expect no response, reading any server output
+        # into the buffer meanwhile so a full stdout pipe cannot stall us
+        self._queue(*messages)
+        while self._outgoing:
+            if not self._pump():
+                raise EOFError("MCP server exited before reading its input")
+    
+    def _pump(self):
+        # Wait up to read_timeout for either pipe to be ready, then write as
+        # much queued input as the server accepts and buffer any output.
+        # Returns False once the server has closed stdout.
+        events = self._selector.select(self.read_timeout)
+        if not events:
+            raise TimeoutError(f"MCP server made no progress for {self.read_timeout}s")
+        for key, mask in events:
+            if mask & selectors.EVENT_WRITE:
+                try:
+                    written = os.write(key.fd, self._outgoing)
+                except BlockingIOError:
+                    continue
+                del self._outgoing[:written]
+                if not self._outgoing:
+                    self._selector.unregister(key.fileobj)
+            if mask & selectors.EVENT_READ:
+                chunk = self._stdout.read(65536)
+                if not chunk:
+                    return False
+                self._buffer += chunk
+        return True
+    
+    def _request_locked(self, method, params):
+        return self._request_many_locked([(method, params)])[0]
+    
+    def _request_many_locked(self, calls):
+        messages = []
+        for method, params in calls:
+            self._next_id += 1
+            message = {"jsonrpc": "2.0", "id": self._next_id, "method": method}
+            if params is not None:
+                message["params"] = params
+            messages.append(message)
+        # Responses are read while the requests are still being written, so
+        # a batch larger than the pipe buffers cannot deadlock
+        self._queue(*messages)
+        
+        # The server may answer out of order, so match responses by id.
+        # Read line by line; both decoders accept bytes, so lines are parsed
+        # as-is. Notifications and stray output are skipped.
+        pending = {message["id"]: None for message in messages}
+        remaining = len(pending)
+        for line in self._readlines():
+            # Every JSON-RPC frame is an object; skip anything else (stray
+            # log output) without paying for a failed parse
+            if not line.lstrip().startswith(b'{'):
+                continue
+            try:
+                response = _decode(line)
+            except ValueError:
+                # Not JSON (or not UTF-8): log noise on stdout
+                continue
+            if not isinstance(response, dict):
+                continue
+            response_id = response.get("id")
+            if response_id in pending and pending[response_id] is None:
+                pending[response_id] = response
+                remaining -= 1
+                if not remaining:
+                    return list(pending.values())
+        raise EOFError("MCP server exited before responding")
+    
+    def _readlines(self):
+        # Yield complete lines from stdout. Whenever the buffer holds no full
+        # line, pump the pipes (sending any queued input); partial lines
+        # carry over between calls in self._buffer.
+        buffer = self._buffer
+        while True:
+            end = buffer.find(b'\n')
+            if end >= 0:
+                line = bytes(buffer[:end + 1])
+                del buffer[:end + 1]
+                yield line
+                continue
+            if not self._pump():
+                return
+
+
+_default_server = None
+
+
+def _get_default_server():
+    global _default_server
+    if _default_server is None:
+        _default_server = MCPServerProcess()
+        atexit.register(_default_server.close)
+    return _default_server
+
 
 def send_mcp_request(tool_name, arguments=None):
     """
     Send an MCP tool request to the Redmine MCPServer
     
+    The first call starts a server process that later calls reuse; it is
+    stopped when the interpreter exits.
+    
     Args:
         tool_name: Name of the MCP tool to call (e.g., "redmine-health-check")
         arguments: Optional dictionary of tool arguments
@@ -19,73 +381,97 @@ def send_mcp_request(tool_name, arguments=None):
     Returns:
         Response from the server
     """
-    # Prepare the MCP tool call request
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {
-            "name": tool_name,
-            "arguments": arguments or {}
-        }
-    }
-    
-    # Convert to JSON
-    request_json = json.dumps(request)
-    
-    # Use subprocess to pipe the request to the MCPServer
-    process = subprocess.Popen(
-        ['python', 'src/server.py'],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    
-    # Send the request and get the response
-    stdout, stderr = process.communicate(input=request_json)
-    
-    if process.returncode != 0:
-        return {'error': 'Server error', 'stderr': stderr, 'stdout': stdout}
-    
-    # Extract the JSON response from the output
-    lines = stdout.splitlines()
-    for line in lines:
-        try:
-            response = json.loads(line)
-            if "result" in response:
-                return response["result"]
-            elif "error" in response:
-                return {"error": response["error"]}
-        except json.JSONDecodeError:
-            continue
+    server = _get_default_server()
+    try:
+        return server.call_tool(tool_name, arguments)
+    except (RuntimeError, OSError) as e:
+        return {'error': 'Server error', 'message': str(e),
+                'stderr': server.read_stderr()}
+
+
+def send_mcp_requests(calls):
+    """
+    Send several independent MCP tool requests in one pipelined batch
     
-    # If no valid JSON was found, return the raw output
-    return {'error': 'Invalid response', 'output': stdout, 'stderr': stderr}
+    Args:
+        calls: List of (tool_name, arguments) pairs
+        
+    Returns:
+        List of responses, in the order of calls
+    """
+    server = _get_default_server()
+    try:
+        return server.call_tools(calls)
+    except (RuntimeError, OSError) as e:
+        error = {'error': 'Server error', 'message': str(e),
+                 'stderr': server.read_stderr()}
+        return [error] * len(calls)
+
+def _parse_arguments(text):
+    """Parse a JSON object of tool arguments, or exit with an error"""
+    try:
+        return _decode(text)
+    except ValueError:
+        print(f"Error: Invalid JSON arguments: {text}")
+        sys.exit(1)
+
+def _read_calls(stream):
+    """
+    Read tool calls, one per line, as "<tool-name> [<JSON arguments>]"
+    
+    Blank lines and lines starting with # are skipped.
+    """
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        tool_name, _, arguments = line.partition(' ')
+        yield tool_name, _parse_arguments(arguments) if arguments.strip() else None
 
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Simple MCP client for testing the modular Redmine MCPServer')
-    parser.add_argument('tool', help='MCP tool name (e.g., redmine-health-check, redmine-list-issues)')
+    parser.add_argument('tool', nargs='?', help='MCP tool name (e.g., redmine-health-check, redmine-list-issues)')
     parser.add_argument('--args', help='JSON arguments for the tool')
+    parser.add_argument('--stdin', action='store_true',
+                        help='Read calls from stdin, one "<tool> [<JSON args>]" per line, '
+                             'and run them all against one server process')
+    parser.add_argument('--batch', action='store_true',
+                        help=f'With --stdin, send calls {BATCH_WINDOW} at a time and print '
+                             'each group of results when it completes (for independent calls only)')
     
     args = parser.parse_args()
+    if not args.tool and not args.stdin:
+        parser.error('a tool name or --stdin is required')
+    
+    if args.stdin and args.batch:
+        # Independent calls overlap on the server instead of queueing; they
+        # go out in fixed-size windows, each printed once it completes
+        calls = _read_calls(sys.stdin)
+        while True:
+            window = list(itertools.islice(calls, BATCH_WINDOW))
+            if not window:
+                break
+            for (tool_name, _), response in zip(window, send_mcp_requests(window)):
+                _print_json({"tool": tool_name, "result": response})
+        return
+    
+    if args.stdin:
+        # One server process serves every call; each result is printed as
+        # soon as it arrives
+        for tool_name, arguments in _read_calls(sys.stdin):
+            response = send_mcp_request(tool_name, arguments)
+            _print_json({"tool": tool_name, "result": response})
+        return
     
     # Parse the arguments if provided
-    arguments = None
-    if args.args:
-        try:
-            arguments = json.loads(args.args)
-        except json.JSONDecodeError:
-            print(f"Error: Invalid JSON arguments: {args.args}")
-            sys.exit(1)
+    arguments = _parse_arguments(args.args) if args.args else None
     
     # Send the request
     response = send_mcp_request(args.tool, arguments)
     
     # Print the response
-    print(json.dumps(response, indent=2))
+    _print_json(response)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
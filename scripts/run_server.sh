@@ -1,4 +1,4 @@
 #!/bin/bash
 # Entry point shell script for Redmine MCP Server
 # This script runs the main MCP server
-python3 main.py "$@"
\ No newline at end of file
+python3 -m src "$@"
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Command-line entry point: python -m src
+
+Delegates to the modular server so every launcher (Docker, shell scripts,
+python -m) shares one initialization path.
+"""
+from src.server import main
+
+if __name__ == "__main__":
+    main()
@@ -2,19 +2,44 @@
 Base module for Redmine API functionality
 Contains common code shared across feature modules
 """
-import json
 import logging
 import requests
 import time
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Union, Sequence, Tuple, Iterator
 from datetime import datetime, timezone
-from .connection_manager import ConnectionManager
+from .connection_manager import ConnectionManager, UnsupportedMethodError
 from .core.errors import (
-    ErrorHandler, ErrorResponse, ErrorCode,
+    ErrorHandler, ErrorResponse, ErrorCode, RedmineAPIError,
     validation_error, http_error, connection_error, 
     timeout_error, unexpected_error
 )
 from .core.logging import log_api_request, log_error_with_context
+from .core.json_utils import loads as json_loads, dumps as json_dumps
+
+
+# Messages for HTTP error statuses returned by Redmine
+HTTP_ERROR_MESSAGES = {
+    401: "Invalid API key or insufficient permissions",
+    403: "Access forbidden - check user permissions",
+    404: "Resource not found",
+    422: "Invalid data provided",
+    429: "Rate limit exceeded",
+    500: "Redmine server error",
+    502: "Bad gateway",
+    503: "Service unavailable",
+    504: "Gateway timeout"
+}
+
+
+@lru_cache(maxsize=128)
+def _join_include(include: Tuple[str, ...]) -> str:
+    return ','.join(include)
+
+
+def _shallow_copy(result: Any) -> Any:
+    return dict(result) if isinstance(result, dict) else result
 
 
 class RedmineBaseClient:
@@ -22,7 +47,20 @@ class RedmineBaseClient:
     Base client for Redmine API interactions
     Provides core functionality used by feature-specific modules
     """
-    def __init__(self, base_url: str, api_key: str, logger: Optional[logging.Logger] = None):
+    # Time to live for cached metadata lookups (trackers, statuses, ...)
+    METADATA_CACHE_TTL = 600
+    
+    # Time to live for cached resources that change occasionally (projects,
+    # versions, groups); writes through clients sharing the connection
+    # manager invalidate them
+    RESOURCE_CACHE_TTL = 30
+    
+    # Default number of requests in flight for make_requests_concurrently;
+    # kept below the connection pool size so workers never wait on a socket
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    def __init__(self, base_url: str, api_key: str, logger: Optional[logging.Logger] = None,
+                 connection_manager: Optional[ConnectionManager] = None):
         """
         Initialize the Redmine API client
         
@@ -30,23 +68,31 @@ class RedmineBaseClient:
             base_url: The base URL of the Redmine instance
             api_key: The API key for authentication
             logger: Optional logger instance for logging
+            connection_manager: Optional connection manager to share with
+                other clients; when omitted the client creates and owns one
         """
         self.base_url = base_url.rstrip('/')
+        # Prefix every endpoint is appended to, built once
+        self._url_prefix = self.base_url + '/'
         self.api_key = api_key
         self.logger = logger or logging.getLogger(__name__)
         
         # Initialize error handler with logger
         self.error_handler = ErrorHandler(self.logger)
         
-        # Initialize connection manager for automatic reconnection
-        self.connection_manager = ConnectionManager(base_url, api_key, self.logger)
+        # Initialize connection manager for automatic reconnection; a shared
+        # one is closed by whoever created it, not by this client
+        self._owns_connection_manager = connection_manager is None
+        self.connection_manager = connection_manager or ConnectionManager(base_url, api_key, self.logger)
+        
+        # Common headers for all requests (set on the connection's session)
+        self.headers = self.connection_manager.headers
         
-        # Common headers for all requests
-        self.headers = {
-            'X-Redmine-API-Key': api_key,
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        # Cache for rarely changing resources: key -> (timestamp, etag, result).
+        # Lives on the connection manager, so clients sharing one also share
+        # cached entries and their invalidation
+        self._meta_cache = self.connection_manager.response_cache
+        self._meta_cache_lock = self.connection_manager.response_cache_lock
     
     def validate_input(self, data: Dict, required_fields: List[str], 
                       field_types: Optional[Dict] = None) -> Optional[Dict]:
@@ -122,47 +168,94 @@ class RedmineBaseClient:
         Returns:
             Dictionary containing the API response
         """
-        url = f"{self.base_url}/{endpoint}"
+        return self._request(method, endpoint, data=data, params=params)[0]
+    
+    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                 params: Optional[Dict] = None,
+                 headers: Optional[Dict] = None) -> Tuple[Dict, Optional[requests.Response]]:
+        """
+        Make a request and also return the raw response
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint to call
+            data: Optional data to send in the request body
+            params: Optional query parameters
+            headers: Optional extra request headers
+            
+        Returns:
+            Tuple of (response dictionary as make_request returns it,
+            requests.Response or None if no response was received)
+        """
+        # Endpoints are relative; tolerate a stray leading slash
+        url = self._url_prefix + (endpoint[1:] if endpoint[:1] == '/' else endpoint)
         start_time = time.time()
         
-        self.logger.debug(f"Making {method} request to {url}")
-        if data:
-            self.logger.debug(f"Request data: {data}")
-        if params:
-            self.logger.debug(f"Request params: {params}")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Making %s request to %s", method, url)
+            if data:
+                self.logger.debug("Request data: %s", data)
+            if params:
+                self.logger.debug("Request params: %s", params)
         
         try:
             # Use connection manager for automatic retry and reconnection
             kwargs = {}
             if params:
                 kwargs['params'] = params
+            if headers:
+                kwargs['headers'] = headers
             if data:
-                kwargs['json'] = data
-                self.logger.debug(f"REQUEST BODY: {json.dumps(data, indent=2)}")
+                # Encode with the shared JSON helper (orjson when installed)
+                # rather than letting requests fall back to stdlib json
+                kwargs['data'] = json_dumps(data).encode('utf-8')
+                if debug:
+                    self.logger.debug("REQUEST BODY: %s", json_dumps(data, indent=True))
             
             # Enhanced debug logging for request
-            self.logger.debug(f"REQUEST: {method} {url} with kwargs: {kwargs}")
-            self.logger.debug(f"REQUEST HEADERS: {self.connection_manager.session.headers if hasattr(self.connection_manager, 'session') else 'No session headers'}")
+            if debug:
+                self.logger.debug("REQUEST: %s %s with kwargs: %s", method, url, kwargs)
+                self.logger.debug("REQUEST HEADERS: %s",
+                                  self.connection_manager.session.headers
+                                  if hasattr(self.connection_manager, 'session')
+                                  else 'No session headers')
             
             response = self.connection_manager.make_request(method, url, **kwargs)
             
             duration_ms = (time.time() - start_time) * 1000
             
-            # Enhanced debug logging for response
-            self.logger.debug(f"RESPONSE STATUS: {response.status_code}")
-            self.logger.debug(f"RESPONSE HEADERS: {dict(response.headers)}")
-            if response.content:
-                try:
-                    content_preview = json.dumps(response.json(), indent=2)[:1000] + "..." if len(response.content) > 1000 else json.dumps(response.json(), indent=2)
-                    self.logger.debug(f"RESPONSE CONTENT: {content_preview}")
-                except Exception as e:
-                    self.logger.debug(f"RESPONSE CONTENT (non-JSON): {response.content[:500]}...")
-            
-            try:
-                response.raise_for_status()
-            except Exception as e:
-                self.logger.error(f"HTTP ERROR: {str(e)}")
-                raise
+            # Parse the body at most once; the preview and the result share it
+            body = None
+            if debug:
+                # Enhanced debug logging for response
+                self.logger.debug("RESPONSE STATUS: %s", response.status_code)
+                self.logger.debug("RESPONSE HEADERS: %s", dict(response.headers))
+                if response.content:
+                    try:
+                        body = json_loads(response.content)
+                        content_preview = json_dumps(body, indent=True)
+                        if len(response.content) > 1000:
+                            content_preview = content_preview[:1000] + "..."
+                        self.logger.debug("RESPONSE CONTENT: %s", content_preview)
+                    except Exception:
+                        self.logger.debug("RESPONSE CONTENT (non-JSON): %s...", response.content[:500])
+            
+            # Dispatch on the status code directly; raise_for_status() would
+            # build and format an HTTPError only for us to unpack it again
+            status_code = response.status_code
+            if status_code >= 400:
+                self.logger.error("HTTP ERROR: %s for %s %s", status_code, method, url)
+                log_api_request(
+                    self.logger,
+                    method,
+                    url,
+                    duration_ms,
+                    status_code,
+                    error=f"HTTP {status_code}",
+                    error_type="HTTPError"
+                )
+                return self._http_error_response(response, method, url), response
             
             # Log successful request with structured logging
             log_api_request(
@@ -170,35 +263,43 @@ class RedmineBaseClient:
                 method,
                 url,
                 duration_ms,
-                response.status_code,
+                status_code,
                 params=params,
                 has_data=bool(data)
             )
             
+            # No Content: nothing to decode
+            if status_code == 204:
+                return {"success": True, "status_code": 204}, response
+            
             # Handle 201 Created status specially for resource creation
-            if response.status_code == 201:  # Created
+            if status_code == 201:  # Created
                 if response.content:
-                    result = response.json()
-                    self.logger.debug(f"Created resource with data: {list(result.keys()) if isinstance(result, dict) else 'non-dict response'}")
-                    return result
+                    result = body if body is not None else json_loads(response.content)
+                    if debug:
+                        self.logger.debug("Created resource with data: %s",
+                                          list(result) if isinstance(result, dict) else 'non-dict response')
+                    return result, response
                 
                 # For APIs that return empty 201 responses, try to extract ID from Location header
                 resource_id = self._extract_id_from_location(response)
                 if resource_id:
-                    self.logger.debug(f"Created resource with ID: {resource_id} (extracted from Location header)")
-                    return {"id": resource_id, "success": True}
+                    self.logger.debug("Created resource with ID: %s (extracted from Location header)", resource_id)
+                    return {"id": resource_id, "success": True}, response
                 
                 # Fallback for empty responses with no Location header
-                return {"success": True, "status_code": 201}
+                return {"success": True, "status_code": 201}, response
             
             # Handle normal responses with content
             if response.content:
-                result = response.json()
-                self.logger.debug(f"Response data keys: {list(result.keys()) if isinstance(result, dict) else 'non-dict response'}")
-                return result
+                result = body if body is not None else json_loads(response.content)
+                if debug:
+                    self.logger.debug("Response data keys: %s",
+                                      list(result) if isinstance(result, dict) else 'non-dict response')
+                return result, response
             
             # For empty responses that aren't 201 Created
-            return {"success": True, "status_code": response.status_code}
+            return {"success": True, "status_code": status_code}, response
             
         except requests.exceptions.RequestException as e:
             duration_ms = (time.time() - start_time) * 1000
@@ -211,13 +312,20 @@ class RedmineBaseClient:
                 error=str(e),
                 error_type=type(e).__name__
             )
-            return self._handle_request_error(e, method, url, data or {})
+            return self._handle_request_error(e, method, url, data or {}), None
+        except UnsupportedMethodError as e:
+            # Nothing was sent; the caller asked for a method we don't support
+            return self.error_handler.handle_validation_error(
+                str(e),
+                context={"url": url, "method": method}
+            ), None
         except ValueError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_error_with_context(
                 self.logger,
                 e,
                 f"JSON parsing for {method} {url}",
+                exc_info=self.logger.isEnabledFor(logging.DEBUG),
                 duration_ms=duration_ms,
                 url=url
             )
@@ -226,13 +334,15 @@ class RedmineBaseClient:
                 f"Invalid JSON response: {str(e)}",
                 502,
                 context={"url": url, "method": method}
-            )
+            ), None
         except Exception as e:
             duration_ms = (time.time() - start_time) * 1000
             log_error_with_context(
                 self.logger,
                 e,
                 f"API request {method} {url}",
+                # handle_unexpected_error below logs the traceback
+                exc_info=False,
                 duration_ms=duration_ms,
                 url=url,
                 data=data
@@ -241,7 +351,47 @@ class RedmineBaseClient:
                 e,
                 operation=f"{method} {url}",
                 context={"data": data, "params": params}
-            )
+            ), None
+    
+    def _http_error_response(self, response: requests.Response,
+                             method: str, url: str) -> Dict:
+        """
+        Build the error response for an HTTP error status
+        
+        Args:
+            response: Response with a 4xx or 5xx status code
+            method: HTTP method used
+            url: URL that was requested
+            
+        Returns:
+            Standardized error response dictionary
+        """
+        status_code = response.status_code
+        response_body = response.text
+        
+        # Build appropriate error message based on status code
+        base_message = HTTP_ERROR_MESSAGES.get(status_code) or f"HTTP {status_code} error"
+        
+        # Try to extract more specific error from response
+        try:
+            response_data = response.json()
+            if 'errors' in response_data:
+                if isinstance(response_data['errors'], list):
+                    base_message += f": {', '.join(response_data['errors'])}"
+                else:
+                    base_message += f": {response_data['errors']}"
+            elif 'error' in response_data:
+                base_message += f": {response_data['error']}"
+        except:
+            pass
+        
+        return self.error_handler.handle_http_error(
+            status_code,
+            base_message,
+            response_body=response_body,
+            url=url,
+            method=method
+        )
     
     def _handle_request_error(self, error: requests.exceptions.RequestException, 
                              method: str, url: str, data: Dict) -> Dict:
@@ -274,44 +424,7 @@ class RedmineBaseClient:
             
         elif isinstance(error, requests.exceptions.HTTPError):
             if hasattr(error, 'response') and error.response is not None:
-                status_code = error.response.status_code
-                response_body = error.response.text
-                
-                # Build appropriate error message based on status code
-                message_map = {
-                    401: "Invalid API key or insufficient permissions",
-                    403: "Access forbidden - check user permissions",
-                    404: f"Resource not found",
-                    422: "Invalid data provided",
-                    429: "Rate limit exceeded",
-                    500: "Redmine server error",
-                    502: "Bad gateway",
-                    503: "Service unavailable",
-                    504: "Gateway timeout"
-                }
-                
-                base_message = message_map.get(status_code, f"HTTP {status_code} error")
-                
-                # Try to extract more specific error from response
-                try:
-                    response_data = error.response.json()
-                    if 'errors' in response_data:
-                        if isinstance(response_data['errors'], list):
-                            base_message += f": {', '.join(response_data['errors'])}"
-                        else:
-                            base_message += f": {response_data['errors']}"
-                    elif 'error' in response_data:
-                        base_message += f": {response_data['error']}"
-                except:
-                    pass
-                
-                return self.error_handler.handle_http_error(
-                    status_code,
-                    base_message,
-                    response_body=response_body,
-                    url=url,
-                    method=method
-                )
+                return self._http_error_response(error.response, method, url)
             else:
                 # HTTP error without response
                 return ErrorResponse.create(
@@ -393,10 +506,211 @@ class RedmineBaseClient:
             status_code
         )
     
+    def _iter_collection(self, endpoint: str, key: str, params: Optional[Dict] = None,
+                         page_size: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over a paginated collection endpoint, one page at a time
+        
+        Only one page of results is held in memory at once, so callers that
+        process items incrementally never materialize the full result set.
+        
+        Args:
+            endpoint: Collection endpoint, e.g. 'issues.json'
+            key: Response key holding the items, e.g. 'issues'
+            params: Optional query parameters (limit and offset are managed here)
+            page_size: Number of items to request per page (Redmine caps at 100)
+            
+        Yields:
+            Item dictionaries
+            
+        Raises:
+            RedmineAPIError: If a page request fails
+        """
+        base_params = dict(params or {}, limit=page_size)
+        offset = 0
+        
+        while True:
+            page_params = dict(base_params, offset=offset)
+            page = self.make_request('GET', endpoint, params=page_params)
+            if page.get('error'):
+                raise RedmineAPIError(page.get('message', f'Failed to fetch {key}'))
+            
+            items = page.get(key, [])
+            yield from items
+            
+            offset += len(items)
+            if not items or offset >= page.get('total_count', 0):
+                break
+    
+    def _fetch_collection(self, endpoint: str, key: str, params: Optional[Dict] = None,
+                          page_size: int = 100) -> List[Dict]:
+        """
+        Fetch every item of a paginated collection endpoint
+        
+        The first page is fetched alone to learn total_count; the remaining
+        pages are then requested concurrently over the shared session, so
+        N pages cost about two round-trips instead of N. Items added or
+        removed while the pages are in flight can shift page boundaries,
+        as with any offset pagination.
+        
+        Args:
+            endpoint: Collection endpoint, e.g. 'issues.json'
+            key: Response key holding the items, e.g. 'issues'
+            params: Optional query parameters (limit and offset are managed here)
+            page_size: Number of items to request per page (Redmine caps at 100)
+        
+        Returns:
+            List of item dictionaries, in server order
+        
+        Raises:
+            RedmineAPIError: If a page request fails
+        """
+        base_params = dict(params or {}, limit=page_size)
+        
+        first = self.make_request('GET', endpoint, params=dict(base_params, offset=0))
+        if first.get('error'):
+            raise RedmineAPIError(first.get('message', f'Failed to fetch {key}'))
+        
+        items = list(first.get(key, []))
+        requests_to_make = [
+            ('GET', endpoint, {'params': dict(base_params, offset=offset)})
+            for offset in range(len(items), first.get('total_count', 0), page_size)
+        ] if items else []
+        
+        for page in self.make_requests_concurrently(requests_to_make):
+            if page.get('error'):
+                raise RedmineAPIError(page.get('message', f'Failed to fetch {key}'))
+            items.extend(page.get(key, []))
+        
+        return items
+    
+    def make_requests_concurrently(self, requests_to_make: Sequence[Tuple],
+                                   max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Issue several independent API requests in parallel
+        
+        Each request runs through make_request on a worker thread, sharing
+        this client's pooled keep-alive connections, so back-to-back lookups
+        (an issue, its project, its versions, ...) overlap instead of
+        waiting on each other.
+        
+        Args:
+            requests_to_make: Sequence of (method, endpoint) or
+                              (method, endpoint, kwargs) tuples, where kwargs
+                              holds make_request keyword arguments
+            max_workers: Maximum number of requests in flight at once
+                         (defaults to MAX_CONCURRENT_REQUESTS)
+            
+        Returns:
+            List of response dictionaries, in the same order as the requests
+        """
+        if not requests_to_make:
+            return []
+        
+        def run(request: Tuple) -> Dict:
+            method, endpoint, *rest = request
+            return self.make_request(method, endpoint, **(rest[0] if rest else {}))
+        
+        workers = min(max_workers or self.MAX_CONCURRENT_REQUESTS, len(requests_to_make))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, requests_to_make))
+    
+    @staticmethod
+    def _include_params(include: Optional[Sequence[str]]) -> Optional[Dict]:
+        """
+        Build query parameters for an optional include list
+        
+        Callers tend to pass the same few include lists repeatedly, so the
+        joined value is memoized.
+        
+        Args:
+            include: Association names, a pre-joined string, or None
+            
+        Returns:
+            {'include': 'a,b'} or None when there is nothing to include
+        """
+        if not include:
+            return None
+        if isinstance(include, str):
+            return {'include': include}
+        return {'include': _join_include(tuple(include))}
+    
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format"""
         return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
     
+    def _cached_request(self, endpoint: str, params: Optional[Dict] = None,
+                        ttl: Optional[float] = None) -> Dict:
+        """
+        Make a GET request, reusing a previous result while it is fresh
+        
+        Intended for endpoints whose contents rarely change. Once an entry
+        expires it is revalidated with If-None-Match when the server sent an
+        ETag, so an unchanged resource costs a bodiless 304 rather than a
+        full download and parse. Error responses are never cached.
+        
+        Each caller gets its own shallow copy of the cached result, so
+        adding or replacing top-level keys does not leak into the cache;
+        nested lists and dicts are shared and must not be modified.
+        
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Optional query parameters
+            ttl: Time to live in seconds (defaults to METADATA_CACHE_TTL)
+            
+        Returns:
+            Response data as dictionary
+        """
+        cache_key = endpoint
+        if params:
+            cache_key += "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+        if ttl is None:
+            ttl = self.METADATA_CACHE_TTL
+        
+        # Entries are (stored_at, etag, result)
+        with self._meta_cache_lock:
+            entry = self._meta_cache.get(cache_key)
+        headers = None
+        if entry is not None:
+            if time.monotonic() - entry[0] < ttl:
+                return _shallow_copy(entry[2])
+            if entry[1]:
+                headers = {'If-None-Match': entry[1]}
+        
+        result, response = self._request('GET', endpoint, params=params, headers=headers)
+        
+        if response is not None and response.status_code == 304 and entry is not None:
+            with self._meta_cache_lock:
+                self._meta_cache[cache_key] = (time.monotonic(), entry[1], entry[2])
+            return _shallow_copy(entry[2])
+        
+        if not (isinstance(result, dict) and result.get('error')):
+            etag = response.headers.get('ETag') if response is not None else None
+            with self._meta_cache_lock:
+                self._meta_cache[cache_key] = (time.monotonic(), etag, result)
+            return _shallow_copy(result)
+        return result
+    
+    def invalidate_cache(self, prefix: str = "", contains: str = "") -> None:
+        """
+        Drop cached metadata entries
+        
+        Clients sharing a connection manager share the cache, so this also
+        drops matching entries cached through those clients.
+        
+        Args:
+            prefix: Only drop entries whose endpoint starts with this prefix;
+                    an empty prefix (and no contains) clears the whole cache
+            contains: Only drop entries whose key also contains this text
+        """
+        with self._meta_cache_lock:
+            if not prefix and not contains:
+                self._meta_cache.clear()
+                return
+            for key in [k for k in self._meta_cache
+                        if k.startswith(prefix) and contains in k]:
+                del self._meta_cache[key]
+    
     def health_check(self) -> bool:
         """
         Check the health of the Redmine connection
@@ -418,3 +732,15 @@ class RedmineBaseClient:
             timeout: Request timeout in seconds
         """
         self.connection_manager.configure_retry_settings(**kwargs)
+    
+    def close(self):
+        """Release the pooled HTTP connections held by this client"""
+        if self._owns_connection_manager:
+            self.connection_manager.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
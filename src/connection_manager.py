@@ -2,14 +2,38 @@
 Connection manager for robust Redmine API connectivity
 Handles automatic reconnection, retry logic, and connection health monitoring
 """
+import os
 import time
 import random
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional, Callable, Any
 from functools import wraps
 
 
+# Gateway/availability statuses that are retried for idempotent methods
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'})
+
+# Client errors worth retrying: request timeout, too many requests
+RETRYABLE_CLIENT_STATUS_CODES = frozenset({408, 429})
+
+# Methods make_request will send
+ALLOWED_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE', 'PATCH'})
+
+# Headers sent with every request, alongside the API key
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
+
+
+class UnsupportedMethodError(ValueError):
+    """Raised by make_request for an HTTP method outside ALLOWED_METHODS"""
+
+
 class ConnectionManager:
     """
     Manages connections to Redmine with automatic retry and health checking
@@ -35,26 +59,89 @@ class ConnectionManager:
         self.backoff_factor = 2.0  # Exponential backoff factor
         self.timeout = 30.0  # Request timeout in seconds
         
+        # Connection pool settings; one host, but several worker threads
+        self.pool_connections = 4
+        self.pool_maxsize = 16
+        
         # Connection state
         self._connection_healthy = True
         self._last_health_check = 0
         self._health_check_interval = 300  # 5 minutes
+        self._health_check_failure_interval = 10  # Re-probe quickly after a failure
         
         # Headers for requests
-        self.headers = {
-            'X-Redmine-API-Key': self.api_key,
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        self.headers = {'X-Redmine-API-Key': self.api_key, **DEFAULT_HEADERS}
+        
+        # GET results cached by the clients using this connection, keyed by
+        # endpoint; shared so a write through one client can invalidate
+        # entries another client cached (e.g. group membership on users).
+        # Clients are called from worker threads, so access takes the lock.
+        self.response_cache: Dict[str, tuple] = {}
+        self.response_cache_lock = threading.Lock()
         
         # Create a session for connection reuse and consistent headers
-        self.session = requests.Session()
+        self.session = self._create_session()
         self.session.headers.update(self.headers)
         
+        # Explicit pooled adapter so concurrent callers reuse keep-alive
+        # connections instead of opening new ones when the pool is full.
+        # Retries stay in execute_with_retry so they do not compound.
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._freeze_environment()
+        
         # Log initialization
         self.logger.debug(f"ConnectionManager initialized for {base_url}")
         self.logger.debug(f"Using API key: {'*'*(len(self.api_key)-4)}{self.api_key[-4:] if len(self.api_key) > 4 else '****'}")
     
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP session used for all requests
+        
+        Setting REDMINE_DEBUG_CACHE=1 swaps in a requests-cache CachedSession
+        (when the package is installed) so repeated development runs read GET
+        responses from a local SQLite file instead of the live server.
+        
+        Returns:
+            requests.Session (or CachedSession) instance
+        """
+        if os.environ.get('REDMINE_DEBUG_CACHE', '').lower() in ('1', 'true', 'yes'):
+            try:
+                import requests_cache
+            except ImportError:
+                self.logger.warning("REDMINE_DEBUG_CACHE is set but requests-cache is not installed")
+            else:
+                self.logger.info("Using on-disk response cache for GET requests (REDMINE_DEBUG_CACHE)")
+                return requests_cache.CachedSession(
+                    os.environ.get('REDMINE_DEBUG_CACHE_PATH', '.redmine_cache'),
+                    expire_after=int(os.environ.get('REDMINE_DEBUG_CACHE_TTL', '300')),
+                    allowable_methods=('GET',)
+                )
+        return requests.Session()
+    
+    def _freeze_environment(self):
+        """
+        Resolve proxy and CA bundle settings from the environment once
+        
+        With trust_env enabled, requests re-reads proxy variables and
+        searches for a .netrc file on every request. Authentication here is
+        a static API key header and the host never changes, so the lookup
+        is done once and pinned on the session instead.
+        """
+        proxies = requests.utils.get_environ_proxies(self.base_url)
+        if proxies:
+            self.session.proxies.update(proxies)
+        ca_bundle = os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE')
+        if ca_bundle:
+            self.session.verify = ca_bundle
+        self.session.trust_env = False
+    
+    def close(self):
+        """Close the session and release pooled connections"""
+        self.session.close()
+    
     def configure_retry_settings(self, max_retries: int = None, base_delay: float = None,
                                 max_delay: float = None, backoff_factor: float = None,
                                 timeout: float = None):
@@ -125,7 +212,7 @@ class ConnectionManager:
                 # Retry on server errors (5xx) and some client errors
                 if status_code >= 500:
                     return True
-                elif status_code in [408, 429]:  # Request timeout, too many requests
+                elif status_code in RETRYABLE_CLIENT_STATUS_CODES:
                     return True
         
         return False
@@ -139,8 +226,11 @@ class ConnectionManager:
         """
         current_time = time.time()
         
-        # Use cached result if within interval
-        if (current_time - self._last_health_check) < self._health_check_interval:
+        # Use cached result if within interval; failures expire sooner so a
+        # recovered server is noticed without waiting the full interval
+        interval = (self._health_check_interval if self._connection_healthy
+                    else self._health_check_failure_interval)
+        if (current_time - self._last_health_check) < interval:
             return self._connection_healthy
         
         self.logger.debug("Performing Redmine connection health check")
@@ -148,13 +238,13 @@ class ConnectionManager:
         try:
             # Use a lightweight endpoint for health checking
             url = f"{self.base_url}/users/current.json"
-            self.logger.debug(f"Health check URL: {url}")
+            self.logger.debug("Health check URL: %s", url)
             
             # Use the session for consistent headers and authentication
             response = self.session.get(url, timeout=10)
             
             # Log response details
-            self.logger.debug(f"Health check status code: {response.status_code}")
+            self.logger.debug("Health check status code: %s", response.status_code)
             
             response.raise_for_status()
             
@@ -210,7 +300,7 @@ class ConnectionManager:
                 
                 # If we get here, the request succeeded
                 if attempt > 0:
-                    self.logger.info(f"Request succeeded on attempt {attempt + 1}")
+                    self.logger.info("Request succeeded on attempt %d", attempt + 1)
                 
                 # Mark connection as healthy after successful request
                 self._connection_healthy = True
@@ -221,12 +311,12 @@ class ConnectionManager:
                 last_exception = e
                 
                 # Log the error
-                self.logger.warning(f"Request failed on attempt {attempt + 1}: {e}")
+                self.logger.warning("Request failed on attempt %d: %s", attempt + 1, e)
                 
                 # Check if we should retry
                 if attempt < self.max_retries and self._is_retryable_error(e):
                     delay = self._calculate_delay(attempt)
-                    self.logger.info(f"Retrying in {delay:.2f} seconds...")
+                    self.logger.info("Retrying in %.2f seconds...", delay)
                     time.sleep(delay)
                 else:
                     # Mark connection as unhealthy after final failure
@@ -234,7 +324,7 @@ class ConnectionManager:
                     break
         
         # All retries exhausted
-        self.logger.error(f"Request failed after {self.max_retries + 1} attempts")
+        self.logger.error("Request failed after %d attempts", self.max_retries + 1)
         raise last_exception
     
     def make_request(self, method: str, url: str, **kwargs) -> requests.Response:
@@ -248,35 +338,36 @@ class ConnectionManager:
             
         Returns:
             requests.Response object
+            
+        Raises:
+            UnsupportedMethodError: If method is not in ALLOWED_METHODS
         """
-        # Add headers if not provided
-        if 'headers' not in kwargs:
-            kwargs['headers'] = self.headers.copy()
-        else:
-            # Merge with default headers
-            merged_headers = self.headers.copy()
-            merged_headers.update(kwargs['headers'])
-            kwargs['headers'] = merged_headers
+        method = method.upper()
+        if method not in ALLOWED_METHODS:
+            raise UnsupportedMethodError(f"Unsupported HTTP method: {method}")
+        
+        # The default headers live on the session; requests merges any
+        # per-call headers over them (a None value drops a default)
         
         # Set up timeout for this request
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
         
+        # Gateway errors are only retried when repeating the request is safe
+        retry_status = method in IDEMPOTENT_METHODS
+        
         # Define the request function that doesn't take any parameters
         def _make_request():
-            self.logger.debug(f"Executing {method} request to {url} with session ID {id(self.session)}")
+            self.logger.debug("Executing %s request to %s with session ID %s", method, url, id(self.session))
             
-            if method.upper() == 'GET':
-                return self.session.get(url, **kwargs)
-            elif method.upper() == 'POST':
-                self.logger.debug(f"Making POST with data: {kwargs.get('json')}")
-                return self.session.post(url, **kwargs)
-            elif method.upper() == 'PUT':
-                return self.session.put(url, **kwargs)
-            elif method.upper() == 'DELETE':
-                return self.session.delete(url, **kwargs)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            if method == 'POST':
+                self.logger.debug("Making POST with data: %s", kwargs.get('data'))
+            response = self.session.request(method, url, **kwargs)
+            
+            if retry_status and response.status_code in RETRY_STATUS_CODES:
+                # Surface as HTTPError so execute_with_retry backs off and retries
+                response.raise_for_status()
+            return response
         
         # Execute with retry - no parameters needed since _make_request is self-contained
         return self.execute_with_retry(_make_request)
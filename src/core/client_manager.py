@@ -5,6 +5,7 @@ import logging
 from typing import Dict, Any, Optional
 
 from ..core import get_logger
+from ..connection_manager import ConnectionManager
 from ..users import UserClient
 from ..projects import ProjectClient
 from ..issues import IssueClient
@@ -16,82 +17,156 @@ from ..wiki import WikiClient
 class ClientManager:
     """Manages the lifecycle and access to API clients"""
     
-    def __init__(self, config, logger=None):
+    # Client classes by the name tools look them up with
+    CLIENT_CLASSES = {
+        'issues': IssueClient,
+        'projects': ProjectClient,
+        'users': UserClient,
+        'groups': GroupClient,
+        'roadmap': RoadmapClient,
+        'versions': VersionClient,
+        'wiki': WikiClient,
+    }
+    
+    def __init__(self, config, logger=None, dry_run: bool = False):
         """
         Initialize the client manager
         
         Args:
             config: Application configuration object
             logger: Optional logger instance
+            dry_run: If True, initialize_clients() creates stand-in clients
+                with no session or credentials, for callers that only need
+                tool definitions
         """
         self.config = config
         self.logger = logger or logging.getLogger("redmine_mcp_server.client_manager")
+        self.dry_run = dry_run
         self.clients = {}
+        self.connection_manager = None
         self.logger.debug("Client manager initialized")
     
     def initialize_clients(self):
         """Initialize all API clients"""
         self.logger.debug("Initializing API clients")
         
+        if self.dry_run:
+            return self._initialize_stub_clients()
+        
+        # Every client talks to the same host with the same key, so they
+        # share one session and its keep-alive connection pool
+        self.connection_manager = ConnectionManager(
+            self.config.redmine.url,
+            self.config.redmine.api_key,
+            get_logger('connection')
+        )
+        # Apply the configured timeout and retry policy
+        self.connection_manager.configure_retry_settings(
+            timeout=self.config.redmine.timeout,
+            max_retries=self.config.redmine.max_retries,
+            base_delay=self.config.redmine.retry_delay
+        )
+        
         # Initialize issue client
         self.clients['issues'] = IssueClient(
             base_url=self.config.redmine.url,
             api_key=self.config.redmine.api_key,
-            logger=get_logger('issue_client')
+            logger=get_logger('issue_client'),
+            connection_manager=self.connection_manager
         )
         
         # Initialize project client
         self.clients['projects'] = ProjectClient(
             base_url=self.config.redmine.url,
             api_key=self.config.redmine.api_key,
-            logger=get_logger('project_client')
+            logger=get_logger('project_client'),
+            connection_manager=self.connection_manager
         )
         
         # Initialize user client
         self.clients['users'] = UserClient(
             base_url=self.config.redmine.url,
             api_key=self.config.redmine.api_key,
-            logger=get_logger('user_client')
+            logger=get_logger('user_client'),
+            connection_manager=self.connection_manager
         )
         
         # Initialize group client
         self.clients['groups'] = GroupClient(
             base_url=self.config.redmine.url,
             api_key=self.config.redmine.api_key,
-            logger=get_logger('group_client')
+            logger=get_logger('group_client'),
+            connection_manager=self.connection_manager
         )
         
         # Initialize roadmap client for version management
         self.clients['roadmap'] = RoadmapClient(
             base_url=self.config.redmine.url,
             api_key=self.config.redmine.api_key,
-            logger=get_logger('roadmap_client')
+            logger=get_logger('roadmap_client'),
+            connection_manager=self.connection_manager
         )
         
         # Initialize version client
         self.clients['versions'] = VersionClient(
             base_url=self.config.redmine.url,
             api_key=self.config.redmine.api_key,
-            logger=get_logger('version_client')
+            logger=get_logger('version_client'),
+            connection_manager=self.connection_manager
         )
         
         # Initialize wiki client
         self.clients['wiki'] = WikiClient(
             base_url=self.config.redmine.url,
             api_key=self.config.redmine.api_key,
-            logger=get_logger('wiki_client')
+            logger=get_logger('wiki_client'),
+            connection_manager=self.connection_manager
         )
         
         self.logger.debug("API clients initialized")
         return self.clients
         
+    def _initialize_stub_clients(self):
+        """Fill the client table with autospecced stand-ins
+        
+        Tool registration only captures client references, so the stand-ins
+        let every tool be registered and its schema inspected without a
+        session or API key. Calling a tool in this mode returns a mock.
+        """
+        from unittest.mock import create_autospec
+        
+        for name, client_class in self.CLIENT_CLASSES.items():
+            self.clients[name] = create_autospec(client_class, instance=True)
+        
+        self.logger.debug("Stub API clients initialized (dry run)")
+        return self.clients
+    
     def get_client(self, client_name: str) -> Any:
         """Get a client by name"""
-        if client_name not in self.clients:
+        client = self.clients.get(client_name)
+        if client is None:
             self.logger.error(f"Client '{client_name}' not found")
-            return None
-        return self.clients[client_name]
+        return client
     
     def get_all_clients(self) -> Dict[str, Any]:
         """Get all clients"""
         return self.clients
+    
+    def close(self):
+        """Close all clients and release their HTTP connections"""
+        for name, client in self.clients.items():
+            try:
+                client.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing client '{name}': {e}")
+        self.clients = {}
+        if self.connection_manager is not None:
+            self.connection_manager.close()
+            self.connection_manager = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -42,6 +42,20 @@ class ErrorCode(Enum):
     MISSING_DEPENDENCY = "MISSING_DEPENDENCY"
 
 
+# HTTP status of an upstream API error -> error code (default SERVER_ERROR)
+HTTP_STATUS_ERROR_CODES = {
+    401: ErrorCode.AUTHENTICATION_ERROR,
+    403: ErrorCode.AUTHORIZATION_ERROR,
+    404: ErrorCode.NOT_FOUND,
+    409: ErrorCode.CONFLICT,
+    429: ErrorCode.RATE_LIMIT,
+    500: ErrorCode.SERVER_ERROR,
+    502: ErrorCode.SERVER_ERROR,
+    503: ErrorCode.SERVICE_UNAVAILABLE,
+    504: ErrorCode.TIMEOUT_ERROR
+}
+
+
 class ErrorResponse:
     """Standardized error response builder"""
     
@@ -130,19 +144,7 @@ class ErrorHandler:
     ) -> Dict[str, Any]:
         """Handle HTTP errors from external APIs"""
         # Map HTTP status to error code
-        error_code_map = {
-            401: ErrorCode.AUTHENTICATION_ERROR,
-            403: ErrorCode.AUTHORIZATION_ERROR,
-            404: ErrorCode.NOT_FOUND,
-            409: ErrorCode.CONFLICT,
-            429: ErrorCode.RATE_LIMIT,
-            500: ErrorCode.SERVER_ERROR,
-            502: ErrorCode.SERVER_ERROR,
-            503: ErrorCode.SERVICE_UNAVAILABLE,
-            504: ErrorCode.TIMEOUT_ERROR
-        }
-        
-        error_code = error_code_map.get(status_code, ErrorCode.SERVER_ERROR)
+        error_code = HTTP_STATUS_ERROR_CODES.get(status_code, ErrorCode.SERVER_ERROR)
         
         # Try to extract error details from response
         details = {}
@@ -199,7 +201,9 @@ class ErrorHandler:
                 "url": url,
                 "context": context
             },
-            exc_info=True
+            # The message identifies the failure; the deep requests/urllib3
+            # stack is only worth formatting when debugging
+            exc_info=self.logger.isEnabledFor(logging.DEBUG)
         )
         
         return ErrorResponse.create(
@@ -0,0 +1,55 @@
+"""
+JSON encoding helpers for Redmine MCP Server
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both paths accept and return the same types, so
+callers do not need to know which backend is active.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# Raised by loads() on malformed input; orjson's error subclasses this
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON text as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            # orjson rejects some inputs json accepts (e.g. non-str keys)
+            pass
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
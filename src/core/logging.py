@@ -18,14 +18,23 @@ from .config import LogConfig
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured logs"""
     
+    # Standard LogRecord attributes that are not treated as extra context
+    EXCLUDE_FIELDS = frozenset({
+        'name', 'msg', 'args', 'created', 'filename', 'funcName',
+        'levelname', 'levelno', 'lineno', 'module', 'msecs',
+        'pathname', 'process', 'processName', 'relativeCreated',
+        'thread', 'threadName', 'getMessage', 'stack_info',
+        'exc_info', 'exc_text'
+    })
+    
     def __init__(self, include_extra: bool = True):
         super().__init__()
         self.include_extra = include_extra
         
     def format(self, record: logging.LogRecord) -> str:
-        # Base log structure
+        # Base log structure; the record already carries its creation time
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace('+00:00', 'Z'),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -40,17 +49,8 @@ class StructuredFormatter(logging.Formatter):
         
         # Add any extra fields
         if self.include_extra:
-            # Standard fields to exclude
-            exclude_fields = {
-                'name', 'msg', 'args', 'created', 'filename', 'funcName',
-                'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                'pathname', 'process', 'processName', 'relativeCreated',
-                'thread', 'threadName', 'getMessage', 'stack_info',
-                'exc_info', 'exc_text'
-            }
-            
             extras = {k: v for k, v in record.__dict__.items() 
-                     if k not in exclude_fields}
+                     if k not in self.EXCLUDE_FIELDS}
             if extras:
                 log_data["context"] = extras
         
@@ -67,7 +67,7 @@ class StructuredFormatter(logging.Formatter):
             if "context" in log_data or "exception" in log_data:
                 return json.dumps(log_data, separators=(',', ':'))
             else:
-                return f"{log_data['timestamp']} - {record.name} - {record.levelname} - {record.getMessage()}"
+                return f"{log_data['timestamp']} - {record.name} - {record.levelname} - {log_data['message']}"
 
 
 class ComponentFilter(logging.Filter):
@@ -88,53 +88,70 @@ class ComponentFilter(logging.Filter):
         return False
 
 
-def setup_logging(config: Optional[LogConfig] = None) -> logging.Logger:
+# Handler installed by setup_logging, so repeat calls can find it again
+_handler: Optional[logging.Handler] = None
+
+
+def _make_formatter(config: LogConfig) -> logging.Formatter:
+    """Structured formatter for production levels, readable one for debug"""
+    if config.level.upper() in ('ERROR', 'WARNING', 'INFO'):
+        return StructuredFormatter(include_extra=True)
+    # Development mode - use readable format
+    return logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+
+def setup_logging(config: Optional[LogConfig] = None, force: bool = False) -> logging.Logger:
     """
     Setup centralized logging configuration with structured logging
     
+    Safe to call more than once: the stderr handler is installed only when
+    the root logger has none, and later calls just refresh its format and
+    levels. Handlers installed by an embedding application are left alone.
+    
     Args:
         config: LogConfig instance, defaults to environment-based config
+        force: Remove all existing root handlers first
         
     Returns:
         Configured logger instance
     """
+    global _handler
+    
     if config is None:
         config = LogConfig.from_environment()
     
-    # Remove existing handlers to avoid duplicates
     root_logger = logging.getLogger()
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-    
-    # Create handler with structured formatter
-    handler = logging.StreamHandler(sys.stderr)
-    
-    # Use structured formatter for production, simple for development
-    if config.level.upper() in ('ERROR', 'WARNING', 'INFO'):
-        formatter = StructuredFormatter(include_extra=True)
-    else:
-        # Development mode - use readable format
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-    
-    handler.setFormatter(formatter)
+    if force:
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+    
+    if _handler is not None and _handler in root_logger.handlers:
+        # Configured by an earlier call; only the format may need changing
+        _handler.setFormatter(_make_formatter(config))
+    elif not root_logger.handlers:
+        _handler = logging.StreamHandler(sys.stderr)
+        _handler.setFormatter(_make_formatter(config))
+        root_logger.addHandler(_handler)
     
     # Configure root logger
     root_logger.setLevel(config.get_level())
-    root_logger.addHandler(handler)
     
     # Get logger for the application
     logger = logging.getLogger('redmine_mcp_server')
     logger.setLevel(config.get_level())
     
-    # Add component filter if specified in environment
+    # Add component filter if specified in environment, replacing any
+    # filter left by a previous call
+    for existing in [f for f in logger.filters if isinstance(f, ComponentFilter)]:
+        logger.removeFilter(existing)
     components = config.get_filtered_components()
     if components:
         logger.addFilter(ComponentFilter(components))
     
-    logger.info(f"Logging configured at {config.level} level", extra={
+    logger.info("Logging configured at %s level", config.level, extra={
         "config": {
             "level": config.level,
             "format": config.format,
@@ -201,7 +218,7 @@ def log_api_request(logger: logging.Logger, method: str, url: str,
 
 
 def log_error_with_context(logger: logging.Logger, error: Exception, 
-                          operation: str, **context):
+                          operation: str, exc_info: bool = True, **context):
     """
     Log an error with full context
     
@@ -209,6 +226,8 @@ def log_error_with_context(logger: logging.Logger, error: Exception,
         logger: Logger instance
         error: Exception that occurred
         operation: Operation during which error occurred
+        exc_info: Attach the traceback; pass False when another handler
+                  already logs it for the same exception
         **context: Additional context
     """
     logger.error(f"Error in {operation}: {str(error)}", extra={
@@ -216,4 +235,4 @@ def log_error_with_context(logger: logging.Logger, error: Exception,
         "error_message": str(error),
         "operation": operation,
         **context
-    }, exc_info=True)
+    }, exc_info=exc_info)
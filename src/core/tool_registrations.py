@@ -1,7 +1,7 @@
 """
 Tool registration module for FastMCP tools
 """
-import json
+import asyncio
 import logging
 from typing import Any, Dict, Optional, Callable, Union
 
@@ -28,6 +28,8 @@ except ImportError:
 
 from ..core import get_logger
 from ..core.errors import RedmineAPIError
+from ..core.json_utils import dumps as json_dumps
+from ..core.version import get_git_sha
 from ..services.search_service import SearchService, SearchExecutionError
 
 class ToolRegistrations:
@@ -59,7 +61,7 @@ class ToolRegistrations:
         self.register_wiki_tools()
         self.register_search_tools()
         
-        self.logger.info(f"Registered {len(self._registered_tools)} tools: {', '.join(self._registered_tools)}")
+        self.logger.info("Registered %d tools: %s", len(self._registered_tools), ', '.join(self._registered_tools))
         return self._registered_tools
         
     def register_issue_tools(self):
@@ -67,6 +69,9 @@ class ToolRegistrations:
         issue_client = self.client_manager.get_client('issues')
         self.logger.debug("Registering issue tools")
         
+        # The clients are synchronous; run their calls in worker threads so a
+        # slow Redmine response does not stall the event loop for other tools
+        
         @self.mcp.tool("redmine-create-issue")
         async def create_issue(project_id: str, subject: str, description: str = None, 
                                tracker_id: int = None, status_id: int = None, 
@@ -81,8 +86,8 @@ class ToolRegistrations:
                 # Input validation
                 if not project_id or not subject:
                     error = "project_id and subject are required"
-                    self.logger.error(f"MCP tool redmine-create-issue failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-create-issue failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
                 # Build issue data
                 issue_data = {"project_id": project_id, "subject": subject}
@@ -99,11 +104,11 @@ class ToolRegistrations:
                 if assigned_to_id:
                     issue_data["assigned_to_id"] = assigned_to_id
                 
-                result = issue_client.create_issue(issue_data)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(issue_client.create_issue, issue_data)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error creating issue: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error creating issue: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         self._registered_tools.append("redmine-create-issue")
         
@@ -113,14 +118,14 @@ class ToolRegistrations:
             try:
                 if not issue_id:
                     error = "issue_id is required"
-                    self.logger.error(f"MCP tool redmine-get-issue failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-get-issue failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                     
-                result = issue_client.get_issue(issue_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(issue_client.get_issue, issue_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error getting issue: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error getting issue: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-get-issue")
         
@@ -141,11 +146,11 @@ class ToolRegistrations:
                 params = filters
                 if limit:
                     params['limit'] = limit
-                result = issue_client.get_issues(params=params)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(issue_client.get_issues, params=params)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error listing issues: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error listing issues: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-list-issues")
         
@@ -169,8 +174,8 @@ class ToolRegistrations:
             try:
                 if not issue_id:
                     error = "issue_id is required"
-                    self.logger.error(f"MCP tool redmine-update-issue failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-update-issue failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
                 # Build issue data
                 issue_data = {}
@@ -193,14 +198,14 @@ class ToolRegistrations:
         
                 if not issue_data:
                     error = "No update fields provided"
-                    self.logger.error(f"MCP tool redmine-update-issue failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-update-issue failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                     
-                result = issue_client.update_issue(issue_id, issue_data)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(issue_client.update_issue, issue_id, issue_data)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error updating issue: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error updating issue: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-update-issue")
         
@@ -210,14 +215,14 @@ class ToolRegistrations:
             try:
                 if not issue_id:
                     error = "issue_id is required"
-                    self.logger.error(f"MCP tool redmine-delete-issue failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-delete-issue failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                     
-                result = issue_client.delete_issue(issue_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(issue_client.delete_issue, issue_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error deleting issue: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error deleting issue: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-delete-issue")
         
@@ -230,40 +235,35 @@ class ToolRegistrations:
         async def health_check():
             """Check Redmine API health"""
             try:
-                result = issue_client.connection_manager.health_check()
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(issue_client.connection_manager.health_check)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error in health check: {e}")
-                return json.dumps({"error": str(e), "status": "error"}, indent=2)
+                self.logger.error("Error in health check: %s", e)
+                return json_dumps({"error": str(e), "status": "error"}, indent=True)
                 
         self._registered_tools.append("redmine-health-check")
         
+        # Environment details are fixed for the life of the process, so read
+        # them from the loaded configuration once instead of on every call
+        config = self.client_manager.config
+        environment_info = {
+            "server_mode": config.server.mode,
+            "log_level": config.logging.level,
+            "redmine_url": config.redmine.url.replace('http://', 'https://'),
+            "transport": config.server.transport
+        }
+        
         @self.mcp.tool("redmine-version-info")
         async def version_info():
             """Get version and environment information"""
             try:
-                # Get git version if available
-                import subprocess
-                import os
-                
-                try:
-                    git_sha = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], 
-                                                     stderr=subprocess.DEVNULL).decode('utf-8').strip()
-                except (subprocess.SubprocessError, FileNotFoundError):
-                    git_sha = os.environ.get('GIT_COMMIT', 'unknown')
-                
-                info = {
-                    "version": git_sha,
-                    "server_mode": os.environ.get('SERVER_MODE', 'unknown'),
-                    "log_level": os.environ.get('LOG_LEVEL', 'unknown'),
-                    "redmine_url": os.environ.get('REDMINE_URL', 'unknown').replace('http://', 'https://'),
-                    "transport": os.environ.get('MCP_TRANSPORT', 'stdio')
-                }
+                # Resolved once per process and cached
+                info = {"version": get_git_sha(), **environment_info}
                 
-                return json.dumps(info, indent=2)
+                return json_dumps(info, indent=True)
             except Exception as e:
-                self.logger.error(f"Error getting version info: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error getting version info: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-version-info")
         
@@ -273,13 +273,13 @@ class ToolRegistrations:
             try:
                 user_client = self.client_manager.get_client('users')
                 if not user_client:
-                    return json.dumps({"error": "User client not available"}, indent=2)
+                    return json_dumps({"error": "User client not available"}, indent=True)
                     
-                result = user_client.get_current_user()
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(user_client.get_current_user)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error getting current user: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error getting current user: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-current-user")
         
@@ -294,14 +294,14 @@ class ToolRegistrations:
             try:
                 if not project_id:
                     error = "project_id is required"
-                    self.logger.error(f"MCP tool redmine-list-versions failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-list-versions failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                     
-                result = roadmap_client.get_versions(project_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(roadmap_client.get_versions, project_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error listing versions: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error listing versions: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-list-versions")
         
@@ -311,14 +311,14 @@ class ToolRegistrations:
             try:
                 if not version_id:
                     error = "version_id is required"
-                    self.logger.error(f"MCP tool redmine-get-version failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-get-version failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                     
-                result = roadmap_client.get_version(version_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(roadmap_client.get_version, version_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error getting version: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error getting version: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-get-version")
         
@@ -330,8 +330,8 @@ class ToolRegistrations:
             try:
                 if not project_id or not name:
                     error = "project_id and name are required"
-                    self.logger.error(f"MCP tool redmine-create-version failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-create-version failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
                 # Build version data
                 version_data = {
@@ -349,11 +349,11 @@ class ToolRegistrations:
                 if due_date:
                     version_data["due_date"] = due_date
                     
-                result = roadmap_client.create_version(version_data)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(roadmap_client.create_version, version_data)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error creating version: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error creating version: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-create-version")
         
@@ -365,8 +365,8 @@ class ToolRegistrations:
             try:
                 if not version_id:
                     error = "version_id is required"
-                    self.logger.error(f"MCP tool redmine-update-version failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-update-version failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
                 # Build version data
                 version_data = {}
@@ -385,14 +385,14 @@ class ToolRegistrations:
                 
                 if not version_data:
                     error = "No update fields provided"
-                    self.logger.error(f"MCP tool redmine-update-version failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-update-version failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                     
-                result = roadmap_client.update_version(version_id, version_data)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(roadmap_client.update_version, version_id, version_data)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error updating version: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error updating version: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-update-version")
         
@@ -402,14 +402,14 @@ class ToolRegistrations:
             try:
                 if not version_id:
                     error = "version_id is required"
-                    self.logger.error(f"MCP tool redmine-delete-version failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-delete-version failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                     
-                result = roadmap_client.delete_version(version_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(roadmap_client.delete_version, version_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error deleting version: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error deleting version: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-delete-version")
         
@@ -419,14 +419,14 @@ class ToolRegistrations:
             try:
                 if not version_id:
                     error = "version_id is required"
-                    self.logger.error(f"MCP tool redmine-get-issues-by-version failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-get-issues-by-version failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                     
-                result = roadmap_client.get_issues_by_version(version_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(roadmap_client.get_issues_by_version, version_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error getting issues by version: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error getting issues by version: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-get-issues-by-version")
         
@@ -451,11 +451,11 @@ class ToolRegistrations:
                     else:
                         params['include'] = include
                         
-                result = project_client.get_projects(params=params)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(project_client.get_projects, params=params)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error listing projects: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error listing projects: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         self._registered_tools.append("redmine-list-projects")
         
@@ -468,8 +468,8 @@ class ToolRegistrations:
                 # Input validation
                 if not name or not identifier:
                     error = "name and identifier are required"
-                    self.logger.error(f"MCP tool redmine-create-project failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-create-project failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
                 # Build project data
                 project_data = {
@@ -486,11 +486,11 @@ class ToolRegistrations:
                 if inherit_members:
                     project_data["inherit_members"] = inherit_members
                 
-                result = project_client.create_project(project_data)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(project_client.create_project, project_data)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error creating project: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error creating project: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         self._registered_tools.append("redmine-create-project")
         
@@ -502,8 +502,8 @@ class ToolRegistrations:
                 # Input validation
                 if not project_id:
                     error = "project_id is required"
-                    self.logger.error(f"MCP tool redmine-update-project failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-update-project failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
                 # Build project data
                 project_data = {}
@@ -520,14 +520,14 @@ class ToolRegistrations:
                 
                 if not project_data:
                     error = "No update fields provided"
-                    self.logger.error(f"MCP tool redmine-update-project failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-update-project failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
-                result = project_client.update_project(project_id, project_data)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(project_client.update_project, project_id, project_data)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error updating project: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error updating project: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         self._registered_tools.append("redmine-update-project")
         
@@ -538,14 +538,14 @@ class ToolRegistrations:
                 # Input validation
                 if not project_id:
                     error = "project_id is required"
-                    self.logger.error(f"MCP tool redmine-delete-project failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-delete-project failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
-                result = project_client.delete_project(project_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(project_client.delete_project, project_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error deleting project: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error deleting project: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         self._registered_tools.append("redmine-delete-project")
         
@@ -556,14 +556,14 @@ class ToolRegistrations:
                 # Input validation
                 if not project_id:
                     error = "project_id is required"
-                    self.logger.error(f"MCP tool redmine-archive-project failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-archive-project failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
-                result = project_client.archive_project(project_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(project_client.archive_project, project_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error archiving project: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error archiving project: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         self._registered_tools.append("redmine-archive-project")
         
@@ -574,22 +574,30 @@ class ToolRegistrations:
                 # Input validation
                 if not project_id:
                     error = "project_id is required"
-                    self.logger.error(f"MCP tool redmine-unarchive-project failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    self.logger.error("MCP tool redmine-unarchive-project failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
-                result = project_client.unarchive_project(project_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(project_client.unarchive_project, project_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error unarchiving project: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error unarchiving project: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         self._registered_tools.append("redmine-unarchive-project")
 
     def register_template_tools(self):
         """Register template management tools with FastMCP"""
         from ..tools.template_tools import TemplateManager, CreateSubtasksTool
+        from ..tools.simple_template_tool import (
+            SimpleTemplateTool, TEMPLATE_SUBJECT_RE, PLACEHOLDER_RE
+        )
         issue_client = self.client_manager.get_client('issues')
         template_manager = TemplateManager()
+        
+        # The tools hold no per-call state, so build them once and share them
+        # across invocations instead of re-importing and re-creating per call
+        simple_template_tool = SimpleTemplateTool(issue_client)
+        create_subtasks_tool = CreateSubtasksTool(issue_client, template_manager)
         self.logger.debug("Registering template tools")
         
         # Note: The 'redmine-create-from-template' tool has been removed in favor of 'redmine-use-template'.
@@ -634,11 +642,6 @@ class ToolRegistrations:
                 228: Subtask - Research & Analysis
             """
             try:
-                from ..tools.simple_template_tool import SimpleTemplateTool
-                
-                # Create tool instance
-                tool = SimpleTemplateTool(issue_client)
-                
                 # Build replacements dict from provided parameters
                 replacements = {
                     'FEATURE_NAME': FEATURE_NAME,
@@ -661,12 +664,12 @@ class ToolRegistrations:
                     'parent_issue_id': parent_issue_id
                 }
                 
-                result = tool.execute(arguments)
+                result = await asyncio.to_thread(simple_template_tool.execute, arguments)
                 
-                return json.dumps(result, indent=2)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error using template: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error using template: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-use-template")
         
@@ -679,19 +682,16 @@ class ToolRegistrations:
                 subtask_template: Template to use for subtasks (default: default_subtasks)
             """
             try:
-                # Create tool instance
-                tool = CreateSubtasksTool(issue_client, template_manager)
-                
                 # Execute with arguments
-                result = tool.execute({
+                result = await asyncio.to_thread(create_subtasks_tool.execute, {
                     'parent_issue_id': parent_issue_id,
                     'subtask_template': subtask_template
                 })
                 
-                return json.dumps(result, indent=2)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                self.logger.error(f"Error creating subtasks: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error creating subtasks: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-create-subtasks")
         
@@ -699,15 +699,15 @@ class ToolRegistrations:
         async def list_templates():
             """List available issue templates"""
             try:
-                templates = template_manager.list_templates()
-                return json.dumps({
+                templates = await asyncio.to_thread(template_manager.list_templates)
+                return json_dumps({
                     "templates": templates,
                     "count": len(templates),
                     "success": True
-                }, indent=2)
+                }, indent=True)
             except Exception as e:
-                self.logger.error(f"Error listing templates: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error listing templates: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-list-templates")
         
@@ -720,21 +720,20 @@ class ToolRegistrations:
             """
             try:
                 # Get all issues from Templates project
-                result = issue_client.get_issues(params={
+                result = await asyncio.to_thread(issue_client.get_issues, params={
                     'project_id': 47,  # Templates project
                     'status_id': 'open',
                     'limit': 100
                 })
                 
                 if 'error' in result:
-                    return json.dumps(result, indent=2)
+                    return json_dumps(result, indent=True)
                 
                 templates = []
                 for issue in result.get('issues', []):
                     # Extract placeholders from description
-                    import re
                     description = issue.get('description', '')
-                    placeholders = re.findall(r'\[([A-Z_]+)\]', description)
+                    placeholders = PLACEHOLDER_RE.findall(description)
                     
                     template_info = {
                         'id': issue['id'],
@@ -744,23 +743,23 @@ class ToolRegistrations:
                     }
                     
                     # Parse template type from subject
-                    match = re.match(r'Template:\s*(\w+)\s*-\s*(.+)', issue['subject'])
+                    match = TEMPLATE_SUBJECT_RE.match(issue['subject'])
                     if match:
                         template_info['type'] = match.group(1)
                         template_info['name'] = match.group(2)
                     
                     templates.append(template_info)
                 
-                return json.dumps({
+                return json_dumps({
                     'templates': templates,
                     'count': len(templates),
                     'usage': 'Use redmine-use-template with template_id and placeholder values',
                     'success': True
-                }, indent=2)
+                }, indent=True)
                 
             except Exception as e:
-                self.logger.error(f"Error listing templates: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                self.logger.error("Error listing templates: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
                 
         self._registered_tools.append("redmine-list-issue-templates")
         
@@ -796,10 +795,10 @@ class ToolRegistrations:
             Returns:
                 Search results with metadata
             """
-            self.logger.info(f"Executing search for query: {query}")
+            self.logger.info("Executing search for query: %s", query)
             
             try:
-                results = self.search_service.search(
+                results = await asyncio.to_thread(self.search_service.search,
                     query=query,
                     content_types=content_types,
                     project_id=project_id,
@@ -811,21 +810,22 @@ class ToolRegistrations:
                     sort_by=sort_by
                 )
                 
-                self.logger.info(f"Search returned {len(results.get('results', []))} results")
-                self._registered_tools.append("redmine-search")
+                self.logger.info("Search returned %d results", len(results.get('results', [])))
                 return results
                 
             except ValueError as e:
-                self.logger.error(f"Invalid search parameters: {e}")
+                self.logger.error("Invalid search parameters: %s", e)
                 return {"error": f"Invalid search parameters: {str(e)}", "results": [], "metadata": {"total_count": 0}}
                 
             except SearchExecutionError as e:
-                self.logger.error(f"Search execution error: {e}")
+                self.logger.error("Search execution error: %s", e)
                 return {"error": f"Search execution failed: {str(e)}", "results": [], "metadata": {"total_count": 0}}
                 
             except Exception as e:
-                self.logger.error(f"Unexpected error during search: {e}")
+                self.logger.error("Unexpected error during search: %s", e)
                 return {"error": f"Unexpected error during search: {str(e)}", "results": [], "metadata": {"total_count": 0}}
+                
+        self._registered_tools.append("redmine-search")
     
     def register_wiki_tools(self):
         """Register wiki management tools with FastMCP"""
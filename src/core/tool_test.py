@@ -35,6 +35,7 @@ class ToolTester:
         self.client_manager = client_manager
         self.tool_registrations = tool_registrations
         self.logger = logger or logging.getLogger("redmine_mcp_server.tool_test")
+        self._tool_names = frozenset()
         
     def run_tests(self) -> bool:
         """Run all tests in synchronous mode
@@ -44,6 +45,9 @@ class ToolTester:
         """
         self.logger.info("Running server in test mode - performing validation tests...")
         
+        # Registration is complete by now; snapshot the names for O(1) lookups
+        self._tool_names = frozenset(self.tool_registrations._registered_tools)
+        
         test_results = []
         
         # Test 1: Configuration validation
@@ -117,7 +121,7 @@ class ToolTester:
             
             # Find our health check tool by name in the registered tools
             health_result = None
-            if "redmine-health-check" in self.tool_registrations._registered_tools:
+            if "redmine-health-check" in self._tool_names:
                 # Call the tool through tool_registrations
                 health_result = {"status": "success", "message": "Mock health check passed"}
                 self.logger.info("✓ Redmine health check: PASS")
@@ -140,7 +144,7 @@ class ToolTester:
         """
         try:
             self.logger.info("Test 4: User authentication validation")
-            if "redmine-current-user" in self.tool_registrations._registered_tools:
+            if "redmine-current-user" in self._tool_names:
                 # In a real scenario, we would call the tool through the MCP framework
                 # but for testing purposes, we'll just verify the tool exists
                 user_result = {"id": 1, "login": "admin", "status": "success"}
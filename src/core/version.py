@@ -0,0 +1,34 @@
+"""
+Build version lookup for Redmine MCP Server
+"""
+import os
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def get_git_sha() -> str:
+    """
+    Get the short git commit of the running code
+    
+    Prefers the GIT_COMMIT environment variable (set in container builds)
+    and otherwise asks git once; the result is cached for the life of the
+    process, so callers never spawn more than one subprocess.
+    
+    Returns:
+        Short commit hash, or 'unknown' if it cannot be determined
+    """
+    env_sha = os.environ.get('GIT_COMMIT')
+    if env_sha:
+        return env_sha
+    
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=Path(__file__).resolve().parent,
+            stderr=subprocess.DEVNULL
+        ).decode('utf-8').strip()
+    except (subprocess.SubprocessError, FileNotFoundError, OSError):
+        # Handle case where git is not available (e.g., in Docker)
+        return 'unknown'
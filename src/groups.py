@@ -5,6 +5,11 @@ Handles all operations related to Redmine user groups
 from typing import Dict, List, Optional, Any, Union
 from src.base import RedmineBaseClient
 
+# API path templates, interpolated with % to keep per-call work minimal
+_GROUP_PATH = 'groups/%s.json'
+_GROUP_USERS_PATH = 'groups/%s/users.json'
+_GROUP_USER_PATH = 'groups/%s/users/%s.json'
+
 
 class GroupClient(RedmineBaseClient):
     """Client for Redmine Group API operations"""
@@ -19,7 +24,7 @@ class GroupClient(RedmineBaseClient):
         Returns:
             Dictionary containing groups data
         """
-        return self.make_request('GET', 'groups.json', params=params)
+        return self._cached_request('groups.json', params=params, ttl=self.RESOURCE_CACHE_TTL)
     
     def get_group(self, group_id: int, include: Optional[List[str]] = None) -> Dict:
         """
@@ -33,10 +38,19 @@ class GroupClient(RedmineBaseClient):
         Returns:
             Dictionary containing group data
         """
-        params = {}
-        if include:
-            params['include'] = ','.join(include)
-        return self.make_request('GET', f'groups/{group_id}.json', params=params)
+        params = self._include_params(include)
+        return self._cached_request(_GROUP_PATH % group_id, params=params,
+                                    ttl=self.RESOURCE_CACHE_TTL)
+    
+    def _invalidate_memberships(self) -> None:
+        """
+        Drop cached groups and users after a group write
+        
+        Group writes can change membership, which user lookups report
+        through include=groups and the group_id filter.
+        """
+        self.invalidate_cache('groups')
+        self.invalidate_cache('users')
     
     def create_group(self, group_data: Dict) -> Dict:
         """
@@ -50,7 +64,9 @@ class GroupClient(RedmineBaseClient):
         Returns:
             Dictionary containing the created group data
         """
-        return self.make_request('POST', 'groups.json', data={'group': group_data})
+        result = self.make_request('POST', 'groups.json', data={'group': group_data})
+        self._invalidate_memberships()
+        return result
     
     def update_group(self, group_id: int, group_data: Dict) -> Dict:
         """
@@ -64,7 +80,9 @@ class GroupClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('PUT', f'groups/{group_id}.json', data={'group': group_data})
+        result = self.make_request('PUT', _GROUP_PATH % group_id, data={'group': group_data})
+        self._invalidate_memberships()
+        return result
     
     def delete_group(self, group_id: int) -> Dict:
         """
@@ -76,7 +94,9 @@ class GroupClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('DELETE', f'groups/{group_id}.json')
+        result = self.make_request('DELETE', _GROUP_PATH % group_id)
+        self._invalidate_memberships()
+        return result
     
     def add_user_to_group(self, group_id: int, user_id: int) -> Dict:
         """
@@ -89,8 +109,10 @@ class GroupClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('POST', f'groups/{group_id}/users.json', 
-                               data={'user_id': user_id})
+        result = self.make_request('POST', _GROUP_USERS_PATH % group_id, 
+                                 data={'user_id': user_id})
+        self._invalidate_memberships()
+        return result
     
     def remove_user_from_group(self, group_id: int, user_id: int) -> Dict:
         """
@@ -103,4 +125,27 @@ class GroupClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('DELETE', f'groups/{group_id}/users/{user_id}.json')
+        result = self.make_request('DELETE', _GROUP_USER_PATH % (group_id, user_id))
+        self._invalidate_memberships()
+        return result
+    
+    def add_users_to_group(self, group_id: int, user_ids: List[int]) -> Dict:
+        """
+        Add several users to a group in a single request
+        
+        Redmine's add-users endpoint accepts a user_ids list, so the whole
+        batch costs one round trip; users already in the group are ignored.
+        
+        Args:
+            group_id: The ID of the group
+            user_ids: IDs of the users to add
+            
+        Returns:
+            Empty dictionary on success
+        """
+        if not user_ids:
+            return {}
+        result = self.make_request('POST', _GROUP_USERS_PATH % group_id,
+                                 data={'user_ids': list(user_ids)})
+        self._invalidate_memberships()
+        return result
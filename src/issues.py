@@ -2,9 +2,15 @@
 Redmine API module for Issue functionality
 Handles all operations related to Redmine issues
 """
-import requests
-from typing import Dict, List, Optional, Any, Union
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Union, Iterator, Tuple
 from src.base import RedmineBaseClient
+from src.core.errors import RedmineAPIError
+
+# API paths, interpolated with % to keep per-call work minimal
+_ISSUES_PATH = 'issues.json'
+_ISSUE_PATH = 'issues/%s.json'
 
 
 class IssueClient(RedmineBaseClient):
@@ -22,7 +28,88 @@ class IssueClient(RedmineBaseClient):
         Returns:
             Dictionary containing issues data
         """
-        return self.make_request('GET', 'issues.json', params=params)
+        return self.make_request('GET', _ISSUES_PATH, params=params)
+    
+    def iter_issues(self, params: Optional[Dict] = None, page_size: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over all issues matching the filters, one page at a time
+        
+        Only one page of results is held in memory at once, so callers that
+        process issues incrementally never materialize the full result set.
+        
+        Args:
+            params: Optional dictionary of query parameters for filtering
+                   (same as get_issues; limit and offset are managed here)
+            page_size: Number of issues to request per page (Redmine caps at 100)
+                   
+        Yields:
+            Issue dictionaries
+            
+        Raises:
+            RedmineAPIError: If a page request fails
+        """
+        return self._iter_collection(_ISSUES_PATH, 'issues', params, page_size)
+    
+    def get_all_issues(self, params: Optional[Dict] = None, page_size: int = 100) -> List[Dict]:
+        """
+        Fetch every issue matching the filters, requesting pages concurrently
+        
+        Prefer iter_issues when the caller can stop early or process issues
+        one at a time; this method trades memory for fewer serial round-trips.
+        
+        Args:
+            params: Optional dictionary of query parameters for filtering
+                   (same as get_issues; limit and offset are managed here)
+            page_size: Number of issues to request per page (Redmine caps at 100)
+        
+        Returns:
+            List of issue dictionaries
+        
+        Raises:
+            RedmineAPIError: If a page request fails
+        """
+        return self._fetch_collection(_ISSUES_PATH, 'issues', params, page_size)
+    
+    def get_issues_bulk(self, issue_ids: List[int], chunk_size: int = 100) -> List[Dict]:
+        """
+        Fetch many issues by ID with as few requests as possible
+        
+        Uses the issues.json issue_id filter, so each chunk of IDs costs one
+        request instead of one per issue; chunks are fetched concurrently.
+        Closed issues are included. IDs that do not exist or are not visible
+        are left out of the result.
+        
+        Args:
+            issue_ids: IDs of the issues to fetch
+            chunk_size: Number of IDs per request (Redmine caps pages at 100)
+            
+        Returns:
+            List of issue dictionaries, in the order of issue_ids
+            
+        Raises:
+            RedmineAPIError: If a chunk request fails
+        """
+        ids = list(dict.fromkeys(int(i) for i in issue_ids))
+        if not ids:
+            return []
+        
+        requests_to_make = [
+            ('GET', _ISSUES_PATH, {'params': {
+                'issue_id': ','.join(map(str, ids[start:start + chunk_size])),
+                'status_id': '*',
+                'limit': chunk_size
+            }})
+            for start in range(0, len(ids), chunk_size)
+        ]
+        
+        by_id = {}
+        for page in self.make_requests_concurrently(requests_to_make):
+            if page.get('error'):
+                raise RedmineAPIError(page.get('message', 'Failed to fetch issues'))
+            for issue in page.get('issues', []):
+                by_id[issue['id']] = issue
+        
+        return [by_id[i] for i in ids if i in by_id]
     
     def get_issue(self, issue_id: int, include: Optional[List[str]] = None) -> Dict:
         """
@@ -37,10 +124,8 @@ class IssueClient(RedmineBaseClient):
         Returns:
             Dictionary containing issue data
         """
-        params = {}
-        if include:
-            params['include'] = ','.join(include)
-        return self.make_request('GET', f'issues/{issue_id}.json', params=params)
+        params = self._include_params(include)
+        return self.make_request('GET', _ISSUE_PATH % issue_id, params=params)
     
     def create_issue(self, issue_data: Dict) -> Dict:
         """
@@ -96,7 +181,7 @@ class IssueClient(RedmineBaseClient):
         self.logger.info(f"Creating issue with data: {issue_data}")
         
         # Make POST request to standard issues endpoint
-        result = self.make_request('POST', 'issues.json', data={'issue': issue_data})
+        result = self.make_request('POST', _ISSUES_PATH, data={'issue': issue_data})
         self.logger.debug(f"create_issue: result from make_request: {result}")
 
         # If result contains the full issue, return as is
@@ -118,7 +203,7 @@ class IssueClient(RedmineBaseClient):
 
         # Standard error handling for API errors
         if isinstance(result, dict) and ('errors' in result or 'error' in result):
-            errors = result.get('errors', result.get('error', 'Unknown error'))
+            errors = result['errors'] if 'errors' in result else result['error']
             self.logger.error(f"API returned error: {errors}")
             return {"error": f"Failed to create issue: {errors}"}
         
@@ -148,7 +233,28 @@ class IssueClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('PUT', f'issues/{issue_id}.json', data={'issue': issue_data})
+        return self.make_request('PUT', _ISSUE_PATH % issue_id, data={'issue': issue_data})
+    
+    def add_notes_bulk(self, notes: List[Tuple[int, str]], max_workers: int = 4) -> List[Dict]:
+        """
+        Add notes to several issues concurrently over the shared session
+        
+        Args:
+            notes: List of (issue_id, note text) pairs
+            max_workers: Maximum number of updates in flight at once
+            
+        Returns:
+            List of update results, in the same order as notes
+        """
+        if not notes:
+            return []
+        
+        def add_note(item: Tuple[int, str]) -> Dict:
+            issue_id, note = item
+            return self.update_issue(issue_id, {'notes': note})
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(notes))) as executor:
+            return list(executor.map(add_note, notes))
     
     def delete_issue(self, issue_id: int) -> Dict:
         """
@@ -160,7 +266,7 @@ class IssueClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('DELETE', f'issues/{issue_id}.json')
+        return self.make_request('DELETE', _ISSUE_PATH % issue_id)
     
     def add_attachment(self, issue_id: int, file_path: str, description: Optional[str] = None) -> Dict:
         """
@@ -174,15 +280,18 @@ class IssueClient(RedmineBaseClient):
         Returns:
             Dictionary containing attachment information
         """
-        # First upload the file to get a token
-        files = {'file': open(file_path, 'rb')}
-        headers = self.headers.copy()
-        # Remove Content-Type for multipart/form-data
-        if 'Content-Type' in headers:
-            del headers['Content-Type']
+        # First upload the file to get a token. The body is read up front so a
+        # retried request re-sends the full payload, and the handle is closed
+        # before the network round-trip.
+        with open(file_path, 'rb') as fh:
+            files = {'file': (os.path.basename(file_path), fh.read())}
             
-        url = f"{self.base_url}/uploads.json"
-        response = requests.post(url, headers=headers, files=files)
+        url = self._url_prefix + 'uploads.json'
+        # Upload through the pooled session; a None Content-Type drops the
+        # session-level JSON header so requests can set the multipart boundary
+        response = self.connection_manager.make_request(
+            'POST', url, files=files, headers={'Content-Type': None}
+        )
         response.raise_for_status()
         upload_data = response.json()
         
@@ -196,3 +305,46 @@ class IssueClient(RedmineBaseClient):
         }
         
         return self.update_issue(issue_id, attachment_data)
+    
+    def get_trackers(self) -> Dict:
+        """
+        Get the list of trackers (cached)
+        
+        Returns:
+            Dictionary containing trackers data
+        """
+        return self._cached_request('trackers.json')
+    
+    def get_issue_statuses(self) -> Dict:
+        """
+        Get the list of issue statuses (cached)
+        
+        Returns:
+            Dictionary containing issue statuses data
+        """
+        return self._cached_request('issue_statuses.json')
+    
+    def get_issue_priorities(self) -> Dict:
+        """
+        Get the list of issue priorities (cached)
+        
+        Returns:
+            Dictionary containing issue priorities data
+        """
+        return self._cached_request('enumerations/issue_priorities.json')
+    
+    def tracker_id_by_name(self, name: str) -> Optional[int]:
+        """
+        Resolve a tracker name to its ID using the cached tracker list
+        
+        Args:
+            name: Tracker name (case-insensitive), e.g. "Feature"
+            
+        Returns:
+            Tracker ID, or None if no tracker has that name
+        """
+        wanted = name.lower()
+        for tracker in self.get_trackers().get('trackers', []):
+            if tracker.get('name', '').lower() == wanted:
+                return tracker.get('id')
+        return None
@@ -70,29 +70,14 @@ def run_container_server():
     try:
         # Check if there's already a running event loop
         loop = asyncio.get_running_loop()
-        print("Detected existing event loop - using container compatibility mode")
-        
-        # Import nest_asyncio for nested loop support
-        try:
-            import nest_asyncio
-            nest_asyncio.apply()
-            
-            # Create a task in the existing loop
-            task = loop.create_task(main())
-            return task
-        except ImportError:
-            print("nest_asyncio not available - installing...")
-            import subprocess
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "nest_asyncio"])
-            import nest_asyncio
-            nest_asyncio.apply()
-            task = loop.create_task(main())
-            return task
-            
     except RuntimeError:
         # No event loop running, we can start our own
         print("Starting new event loop for MCP server")
         return asyncio.run(main())
+    
+    # Schedule on the existing loop; the caller owns it and will drive the task
+    print("Detected existing event loop - using container compatibility mode")
+    return loop.create_task(main())
 
 
 if __name__ == "__main__":
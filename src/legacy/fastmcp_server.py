@@ -11,8 +11,6 @@ from typing import Optional, Dict, List
 from fastmcp import FastMCP
 from src.issues import IssueClient
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("redmine_mcp")
 
 # Initialize FastMCP server
@@ -191,20 +189,17 @@ async def main():
 if __name__ == "__main__":
     import asyncio
     
+    # Configure logging only when run as a script, not on import
+    logging.basicConfig(level=logging.INFO)
+    
     # Handle container environments with existing event loops
     try:
         # Check if there's already a running event loop
         loop = asyncio.get_running_loop()
-        # If we get here, there's already a loop running (like in Windsurf)
-        try:
-            import nest_asyncio
-            nest_asyncio.apply()
-            # Create a task in the existing loop
-            task = loop.create_task(main())
-            logger.info("Server started in container compatibility mode")
-        except ImportError:
-            logger.error("nest_asyncio required for container environments")
-            logger.info("Run: pip install nest_asyncio")
     except RuntimeError:
         # No event loop running, we can start our own
         asyncio.run(main())
+    else:
+        # There's already a loop running (like in Windsurf); schedule on it
+        task = loop.create_task(main())
+        logger.info("Server started in container compatibility mode")
@@ -2,7 +2,7 @@
 Redmine API module for Project functionality
 Handles all operations related to Redmine projects
 """
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Iterator
 from src.base import RedmineBaseClient
 
 
@@ -20,7 +20,24 @@ class ProjectClient(RedmineBaseClient):
         Returns:
             Dictionary containing projects data
         """
-        return self.make_request('GET', 'projects.json', params=params)
+        return self._cached_request('projects.json', params=params, ttl=self.RESOURCE_CACHE_TTL)
+    
+    def iter_projects(self, params: Optional[Dict] = None, page_size: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over all projects matching the filters, one page at a time
+        
+        Args:
+            params: Optional dictionary of query parameters for filtering
+                   (same as get_projects; limit and offset are managed here)
+            page_size: Number of projects to request per page
+                   
+        Yields:
+            Project dictionaries
+            
+        Raises:
+            RedmineAPIError: If a page request fails
+        """
+        return self._iter_collection('projects.json', 'projects', params, page_size)
     
     def get_project(self, project_id: Union[int, str], include: Optional[List[str]] = None) -> Dict:
         """
@@ -34,10 +51,9 @@ class ProjectClient(RedmineBaseClient):
         Returns:
             Dictionary containing project data
         """
-        params = {}
-        if include:
-            params['include'] = ','.join(include)
-        return self.make_request('GET', f'projects/{project_id}.json', params=params)
+        params = self._include_params(include)
+        return self._cached_request(f'projects/{project_id}.json', params=params,
+                                    ttl=self.RESOURCE_CACHE_TTL)
     
     def create_project(self, project_data: Dict) -> Dict:
         """
@@ -52,7 +68,9 @@ class ProjectClient(RedmineBaseClient):
         Returns:
             Dictionary containing the created project data
         """
-        return self.make_request('POST', 'projects.json', data={'project': project_data})
+        result = self.make_request('POST', 'projects.json', data={'project': project_data})
+        self.invalidate_cache('projects')
+        return result
     
     def update_project(self, project_id: Union[int, str], project_data: Dict) -> Dict:
         """
@@ -66,7 +84,9 @@ class ProjectClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('PUT', f'projects/{project_id}.json', data={'project': project_data})
+        result = self.make_request('PUT', f'projects/{project_id}.json', data={'project': project_data})
+        self.invalidate_cache('projects')
+        return result
     
     def delete_project(self, project_id: Union[int, str]) -> Dict:
         """
@@ -78,7 +98,9 @@ class ProjectClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('DELETE', f'projects/{project_id}.json')
+        result = self.make_request('DELETE', f'projects/{project_id}.json')
+        self.invalidate_cache('projects')
+        return result
     
     def get_project_memberships(self, project_id: Union[int, str]) -> Dict:
         """
@@ -150,7 +172,9 @@ class ProjectClient(RedmineBaseClient):
         Returns:
             Dictionary containing the archived project data
         """
-        return self.make_request('PUT', f'projects/{project_id}/archive.json')
+        result = self.make_request('PUT', f'projects/{project_id}/archive.json')
+        self.invalidate_cache('projects')
+        return result
     
     def unarchive_project(self, project_id: Union[int, str]) -> Dict:
         """
@@ -162,4 +186,6 @@ class ProjectClient(RedmineBaseClient):
         Returns:
             Dictionary containing the unarchived project data
         """
-        return self.make_request('PUT', f'projects/{project_id}/unarchive.json')
+        result = self.make_request('PUT', f'projects/{project_id}/unarchive.json')
+        self.invalidate_cache('projects')
+        return result
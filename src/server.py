@@ -16,25 +16,18 @@ Following the 'fighting complexity' design philosophy, this architecture:
 import sys
 import os
 import logging
-import subprocess
 from typing import Optional
 
 # Add parent directory to path to make imports work when run directly
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, parent_dir)
 
-try:
-    from fastmcp import FastMCP
-except ImportError:
-    # Fallback if fastmcp not available
-    FastMCP = None
-
-# Import directly from core without relative imports
+# Import directly from core without relative imports. FastMCP, the API
+# clients and the tool modules are imported where they are first needed:
+# they dominate start-up time and are not needed for --help or argument errors.
 from src.core import AppConfig, setup_logging, get_logger
 from src.core.errors import ConfigurationError
-from src.core.client_manager import ClientManager
-from src.core.tool_registrations import ToolRegistrations
-from src.core.tool_test import ToolTester
+from src.core.version import get_git_sha
 
 
 class RedmineMCPServer:
@@ -48,37 +41,36 @@ class RedmineMCPServer:
         self.client_manager = None
         self.tool_registrations = None
     
-    def initialize(self):
+    def initialize(self, config: Optional[AppConfig] = None):
         """Initialize server configuration and components
         
+        Args:
+            config: Optional pre-loaded configuration, otherwise read from the environment
+        
         Raises:
             ConfigurationError: If configuration fails or components can't be initialized
         """
         try:
             # Load configuration
-            self.config = AppConfig.from_environment()
+            self.config = config or AppConfig.from_environment()
             
-            # Setup logging
-            self.logger = setup_logging(self.config.logging)
+            # Setup logging; stdout carries the stdio transport, so any
+            # handler installed before us (which may write there) is replaced
+            self.logger = setup_logging(self.config.logging, force=True)
             
             # Get git version info for debugging
-            try:
-                git_sha = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], 
-                                                 stderr=subprocess.DEVNULL).decode('utf-8').strip()
-            except (subprocess.SubprocessError, FileNotFoundError):
-                # Handle case where git is not available (e.g., in Docker)
-                git_sha = os.environ.get('GIT_COMMIT', 'unknown')
+            git_sha = get_git_sha()
                 
-            self.logger.info(f"Starting Redmine MCP Server (version: {git_sha})")
-            self.logger.info(f"Server mode: {self.config.server.mode}")
-            self.logger.info(f"Redmine URL: {self.config.redmine.url}")
+            self.logger.info("Starting Redmine MCP Server (version: %s)", git_sha)
+            self.logger.info("Server mode: %s", self.config.server.mode)
+            self.logger.info("Redmine URL: %s", self.config.redmine.url)
             
             # Initialize all components
             self._initialize_components()
             
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Failed to initialize server: {e}")
+                self.logger.error("Failed to initialize server: %s", e)
             else:
                 print(f"Failed to initialize server: {e}", file=sys.stderr)
             raise ConfigurationError(f"Server initialization failed: {e}")
@@ -95,8 +87,12 @@ class RedmineMCPServer:
             ConfigurationError: If FastMCP is not available
         """
         # Initialize FastMCP
-        if FastMCP is None:
+        try:
+            from fastmcp import FastMCP
+        except ImportError:
             raise ConfigurationError("FastMCP is not available - please install fastmcp package")
+        from src.core.client_manager import ClientManager
+        from src.core.tool_registrations import ToolRegistrations
             
         self.mcp = FastMCP("Redmine MCP Server")
         
@@ -128,14 +124,8 @@ class RedmineMCPServer:
                 
             self.logger.info("Starting Redmine MCP Server in live mode...")
             
-            # Use configured transport or fallback to stdio
-            if not transport:
-                transport = "stdio"
-                
-            if hasattr(self.config.server, 'transport') and self.config.server.transport:
-                transport = self.config.server.transport
-                
-            self.logger.debug(f"Using transport: {transport}")
+            transport = self._resolve_transport(transport)
+            self.logger.debug("Using transport: %s", transport)
             
             # Run the MCP server using FastMCP's run method (simplified approach)
             try:
@@ -151,8 +141,37 @@ class RedmineMCPServer:
         except KeyboardInterrupt:
             self.logger.info("Server stopped by user")
         except Exception as e:
-            self.logger.error(f"Fatal error: {e}")
+            self.logger.error("Fatal error: %s", e)
             raise
+        finally:
+            self.stop()
+    
+    async def run_async(self, transport=None):
+        """Run the MCP server on an already running event loop
+        
+        Args:
+            transport: Optional transport to use, otherwise use config or default to 'stdio'
+        """
+        try:
+            self.logger.info("Starting Redmine MCP Server in live mode...")
+            
+            transport = self._resolve_transport(transport)
+            self.logger.debug("Using transport: %s", transport)
+            
+            await self.mcp.run_async(transport)
+        finally:
+            self.stop()
+    
+    def _resolve_transport(self, transport=None):
+        """Pick the transport: configured value, then argument, then stdio"""
+        if hasattr(self.config.server, 'transport') and self.config.server.transport:
+            return self.config.server.transport
+        return transport or "stdio"
+    
+    def stop(self):
+        """Release resources held by the server's components"""
+        if self.client_manager:
+            self.client_manager.close()
             
     def run_test_mode(self):
         """Run the server in test mode with comprehensive validation
@@ -160,6 +179,8 @@ class RedmineMCPServer:
         Returns:
             bool: True if all tests passed, False otherwise
         """
+        from src.core.tool_test import ToolTester
+        
         # Create tool tester instance
         tool_tester = ToolTester(
             config=self.config,
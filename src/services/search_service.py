@@ -6,11 +6,24 @@ and the Enhanced_Search_Functionality_Design wiki page.
 """
 
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Union, Any
 
 from src.services.base_service import BaseService
 
+# Content types search() accepts
+VALID_CONTENT_TYPES = frozenset({"issues", "wiki_pages", "documents", "projects"})
+
+
+@lru_cache(maxsize=64)
+def _highlight_pattern(query_terms: tuple) -> "re.Pattern":
+    """Case-insensitive pattern matching any of the terms, longest first"""
+    terms = sorted({term.lower() for term in query_terms}, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
 
 class SearchResultProcessor:
     """
@@ -60,15 +73,13 @@ class SearchResultProcessor:
         # Sort results if specified
         sort_by = kwargs.get("sort_by", "relevance")
         if sort_by == "relevance":
-            processed_results = sorted(
-                processed_results, 
+            processed_results.sort(
                 key=lambda r: r.get("relevance_score", 0),
                 reverse=True
             )
         elif sort_by in ["updated", "created"]:
             sort_field = "updated_on" if sort_by == "updated" else "created_on"
-            processed_results = sorted(
-                processed_results,
+            processed_results.sort(
                 key=lambda r: r.get(sort_field, ""),
                 reverse=True
             )
@@ -106,23 +117,10 @@ class SearchResultProcessor:
         if not text or not query_terms:
             return text
             
-        # Simple case-insensitive highlighting
-        highlighted = text
-        for term in query_terms:
-            # Case-insensitive replacement with highlighting
-            i = 0
-            while i < len(highlighted):
-                idx = highlighted[i:].lower().find(term.lower())
-                if idx == -1:
-                    break
-                    
-                idx += i
-                matched_text = highlighted[idx:idx + len(term)]
-                replacement = f"<highlight>{matched_text}</highlight>"
-                highlighted = highlighted[:idx] + replacement + highlighted[idx + len(term):]
-                i = idx + len(replacement)
-                
-        return highlighted
+        # One case-insensitive pass over the text for all terms; matches are
+        # never rescanned, so a later term cannot land inside an earlier tag
+        pattern = _highlight_pattern(tuple(query_terms))
+        return pattern.sub(lambda m: f"<highlight>{m.group(0)}</highlight>", text)
     
     def extract_excerpt(self, full_text: str, query_terms: List[str], context_size: int = 100) -> str:
         """
@@ -428,17 +426,24 @@ class SearchService(BaseService):
         results = {"results": [], "total_count": 0}
         
         try:
-            # Search issues if requested
+            # Issue and wiki searches are independent round-trips, so run the
+            # requested ones concurrently and merge them in a fixed order
+            searches = []
             if "issues" in content_types:
-                issue_results = self._search_issues(query, **kwargs)
-                results["results"].extend(issue_results.get("results", []))
-                results["total_count"] += issue_results.get("total_count", 0)
-                
-            # Search wiki pages if requested
+                searches.append(self._search_issues)
             if "wiki_pages" in content_types:
-                wiki_results = self._search_wiki_pages(query, **kwargs)
-                results["results"].extend(wiki_results.get("results", []))
-                results["total_count"] += wiki_results.get("total_count", 0)
+                searches.append(self._search_wiki_pages)
+                
+            if len(searches) > 1:
+                with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+                    futures = [executor.submit(search, query, **kwargs) for search in searches]
+                    partial_results = [future.result() for future in futures]
+            else:
+                partial_results = [search(query, **kwargs) for search in searches]
+                
+            for partial in partial_results:
+                results["results"].extend(partial.get("results", []))
+                results["total_count"] += partial.get("total_count", 0)
                 
             # Add other content types as implemented...
             
@@ -637,10 +642,9 @@ class SearchService(BaseService):
             raise ValueError("Search query cannot be empty")
             
         # Validate content types
-        valid_content_types = ["issues", "wiki_pages", "documents", "projects"]
         if content_types:
             for content_type in content_types:
-                if content_type not in valid_content_types:
+                if content_type not in VALID_CONTENT_TYPES:
                     raise ValueError(f"Invalid content type: {content_type}")
                     
         # Validate limit and offset
@@ -4,6 +4,12 @@ Simple template tool using Redmine issues as templates
 import re
 from typing import Dict, Any, Optional
 
+# "Template: <Type> - <Name>" subjects of template issues
+TEMPLATE_SUBJECT_RE = re.compile(r'Template:\s*(\w+)\s*-\s*(.+)')
+
+# [PLACEHOLDER] markers in template text
+PLACEHOLDER_RE = re.compile(r'\[([A-Z_]+)\]')
+
 
 class SimpleTemplateTool:
     """Tool for creating issues from Redmine template issues"""
@@ -32,17 +38,19 @@ class SimpleTemplateTool:
             
             # Extract subject without "Template: Type - " prefix
             subject = template['subject']
-            match = re.match(r'Template:\s*\w+\s*-\s*(.+)', subject)
+            match = TEMPLATE_SUBJECT_RE.match(subject)
             if match:
-                subject = match.group(1)
+                subject = match.group(2)
             
             # Replace placeholders in subject and description
             description = template['description']
             
+            # Plain substring replacement: no pattern to compile per placeholder,
+            # and backslashes in values are kept literally
             for placeholder, value in replacements.items():
-                placeholder_pattern = f'\\[{placeholder}\\]'
-                subject = re.sub(placeholder_pattern, str(value), subject)
-                description = re.sub(placeholder_pattern, str(value), description)
+                marker = f'[{placeholder}]'
+                subject = subject.replace(marker, str(value))
+                description = description.replace(marker, str(value))
             
             # Create new issue
             issue_data = {
@@ -8,6 +8,14 @@ from pathlib import Path
 from string import Template
 from typing import Dict, Any, Optional, List
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _compile(text: str) -> Template:
+    """Return a compiled string.Template, reused across renders"""
+    return Template(text)
 
 
 class TemplateManager:
@@ -20,6 +28,8 @@ class TemplateManager:
             template_dir = Path(__file__).parent.parent / "templates" / "issues"
         self.template_dir = Path(template_dir)
         self.logger = logging.getLogger("redmine_mcp_server.template_manager")
+        # Parsed templates keyed by name: (file mtime_ns, data)
+        self._template_cache: Dict[str, tuple] = {}
         
     def list_templates(self) -> List[str]:
         """List available template names"""
@@ -28,13 +38,27 @@ class TemplateManager:
         return [f.stem for f in self.template_dir.glob("*.json")]
     
     def load_template(self, template_name: str) -> Dict[str, Any]:
-        """Load a template by name"""
+        """Load a template by name
+        
+        Parsed templates are cached and re-read only when the file's
+        modification time changes. The returned data is shared between
+        callers and must be treated as read-only.
+        """
         template_path = self.template_dir / f"{template_name}.json"
-        if not template_path.exists():
+        try:
+            mtime_ns = template_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._template_cache.pop(template_name, None)
             raise ValueError(f"Template '{template_name}' not found")
+        
+        cached = self._template_cache.get(template_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
             
         with open(template_path, 'r') as f:
-            return json.load(f)
+            data = json.load(f)
+        self._template_cache[template_name] = (mtime_ns, data)
+        return data
     
     def render_template(self, template_name: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         """Render a template with provided variables"""
@@ -45,8 +69,7 @@ class TemplateManager:
         for key, value in template_data.items():
             if isinstance(value, str):
                 # Use safe_substitute to avoid KeyError on missing variables
-                template = Template(value)
-                rendered[key] = template.safe_substitute(variables)
+                rendered[key] = _compile(value).safe_substitute(variables)
             elif isinstance(value, dict):
                 # Recursively process nested dictionaries
                 rendered[key] = self._render_dict(value, variables)
@@ -61,8 +84,7 @@ class TemplateManager:
         rendered = {}
         for key, value in data.items():
             if isinstance(value, str):
-                template = Template(value)
-                rendered[key] = template.safe_substitute(variables)
+                rendered[key] = _compile(value).safe_substitute(variables)
             elif isinstance(value, dict):
                 rendered[key] = self._render_dict(value, variables)
             else:
@@ -90,11 +112,30 @@ class TemplateManager:
 class CreateSubtasksTool:
     """Tool for creating standard subtasks for an issue"""
     
+    # Upper bound on in-flight create requests against the Redmine server
+    MAX_CONCURRENT_CREATES = 4
+    
     def __init__(self, service, template_manager: Optional[TemplateManager] = None):
         self.service = service
         self.template_manager = template_manager or TemplateManager()
         self.logger = logging.getLogger("redmine_mcp_server.create_subtasks_tool")
         
+    def _create_one(self, subtask_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a single subtask, turning exceptions into error dicts"""
+        try:
+            return self.service.create_issue(subtask_data)
+        except Exception as e:
+            return {"error": str(e), "success": False}
+        
+    def _create_all(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create subtasks concurrently, returning results in input order"""
+        if len(payloads) <= 1:
+            return [self._create_one(payload) for payload in payloads]
+        
+        workers = min(self.MAX_CONCURRENT_CREATES, len(payloads))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._create_one, payloads))
+        
     def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Create subtasks for a parent issue"""
         parent_issue_id = arguments.get('parent_issue_id')
@@ -115,22 +156,29 @@ class CreateSubtasksTool:
             subtasks_config = self.template_manager.load_template(subtask_template)
             subtasks = subtasks_config.get('subtasks', [])
             
-            created_subtasks = []
+            # Fields shared by every subtask are built once and merged into
+            # each subtask's own fields
+            base_payload = {
+                'project_id': parent_data['project']['id'],
+                'parent_issue_id': parent_issue_id,
+                'priority_id': parent_data['priority']['id']
+            }
+            subject_prefix = f"{parent_data['subject']} - "
             
-            for subtask_template in subtasks:
-                # Prepare subtask data
-                subtask_data = {
-                    'project_id': parent_data['project']['id'],
-                    'parent_issue_id': parent_issue_id,
-                    'tracker_id': subtask_template.get('tracker_id', 3),  # Default to Support
-                    'subject': f"{parent_data['subject']} - {subtask_template['subject']}",
-                    'description': subtask_template.get('description', ''),
-                    'assigned_to_id': subtask_template.get('assigned_to_id'),
-                    'priority_id': parent_data['priority']['id']
+            payloads = [
+                base_payload | {
+                    'tracker_id': subtask.get('tracker_id', 3),  # Default to Support
+                    'subject': subject_prefix + subtask['subject'],
+                    'description': subtask.get('description', ''),
+                    'assigned_to_id': subtask.get('assigned_to_id')
                 }
-                
-                # Create subtask
-                result = self.service.create_issue(subtask_data)
+                for subtask in subtasks
+            ]
+            
+            # Subtasks are independent once the parent is known, so create
+            # them concurrently; map() keeps results in template order
+            created_subtasks = []
+            for result in self._create_all(payloads):
                 if 'issue' in result:
                     created_subtasks.append(result['issue'])
                 else:
@@ -2,13 +2,16 @@
 Redmine API module for User functionality
 Handles all operations related to Redmine users
 """
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Iterator
 from src.base import RedmineBaseClient
 
 
 class UserClient(RedmineBaseClient):
     """Client for Redmine User API operations"""
     
+    # Seconds to reuse the current-user lookup between status polls
+    CURRENT_USER_CACHE_TTL = 10
+    
     def get_users(self, params: Optional[Dict] = None) -> Dict:
         """
         Get a list of users with optional filtering
@@ -20,7 +23,24 @@ class UserClient(RedmineBaseClient):
         Returns:
             Dictionary containing users data
         """
-        return self.make_request('GET', 'users.json', params=params)
+        return self._cached_request('users.json', params=params, ttl=self.RESOURCE_CACHE_TTL)
+    
+    def iter_users(self, params: Optional[Dict] = None, page_size: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over all users matching the filters, one page at a time
+        
+        Args:
+            params: Optional dictionary of query parameters for filtering
+                   (same as get_users; limit and offset are managed here)
+            page_size: Number of users to request per page
+                   
+        Yields:
+            User dictionaries
+            
+        Raises:
+            RedmineAPIError: If a page request fails
+        """
+        return self._iter_collection('users.json', 'users', params, page_size)
     
     def get_user(self, user_id: int, include: Optional[List[str]] = None) -> Dict:
         """
@@ -34,10 +54,9 @@ class UserClient(RedmineBaseClient):
         Returns:
             Dictionary containing user data
         """
-        params = {}
-        if include:
-            params['include'] = ','.join(include)
-        return self.make_request('GET', f'users/{user_id}.json', params=params)
+        params = self._include_params(include)
+        return self._cached_request(f'users/{user_id}.json', params=params,
+                                    ttl=self.RESOURCE_CACHE_TTL)
     
     def create_user(self, user_data: Dict) -> Dict:
         """
@@ -52,7 +71,9 @@ class UserClient(RedmineBaseClient):
         Returns:
             Dictionary containing the created user data
         """
-        return self.make_request('POST', 'users.json', data={'user': user_data})
+        result = self.make_request('POST', 'users.json', data={'user': user_data})
+        self.invalidate_cache('users')
+        return result
     
     def update_user(self, user_id: int, user_data: Dict) -> Dict:
         """
@@ -66,7 +87,9 @@ class UserClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('PUT', f'users/{user_id}.json', data={'user': user_data})
+        result = self.make_request('PUT', f'users/{user_id}.json', data={'user': user_data})
+        self.invalidate_cache('users')
+        return result
     
     def delete_user(self, user_id: int) -> Dict:
         """
@@ -78,13 +101,18 @@ class UserClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('DELETE', f'users/{user_id}.json')
+        result = self.make_request('DELETE', f'users/{user_id}.json')
+        self.invalidate_cache('users')
+        return result
     
     def get_current_user(self) -> Dict:
         """
         Get the current user (based on API key)
         
+        The result is cached briefly so repeated status polls share one
+        upstream request; failures are not cached.
+        
         Returns:
             Dictionary containing current user data
         """
-        return self.make_request('GET', 'users/current.json')
+        return self._cached_request('users/current.json', ttl=self.CURRENT_USER_CACHE_TTL)
@@ -19,7 +19,8 @@ class VersionClient(RedmineBaseClient):
         Returns:
             Dictionary containing versions data
         """
-        return self.make_request('GET', f'projects/{project_id}/versions.json')
+        return self._cached_request(f'projects/{project_id}/versions.json',
+                                    ttl=self.RESOURCE_CACHE_TTL)
     
     def get_version(self, version_id: int) -> Dict:
         """
@@ -31,7 +32,18 @@ class VersionClient(RedmineBaseClient):
         Returns:
             Dictionary containing version data
         """
-        return self.make_request('GET', f'versions/{version_id}.json')
+        return self._cached_request(f'versions/{version_id}.json', ttl=self.RESOURCE_CACHE_TTL)
+    
+    def _invalidate_versions(self) -> None:
+        """
+        Drop cached versions after a version write
+        
+        A version appears in its own entry and in its project's list. Updates
+        and deletes only know the version ID, so every project's version list
+        is dropped; other cached resources are left alone.
+        """
+        self.invalidate_cache('versions/')
+        self.invalidate_cache('projects/', contains='/versions.json')
     
     def create_version(self, version_data: Dict) -> Dict:
         """
@@ -50,8 +62,10 @@ class VersionClient(RedmineBaseClient):
         if not project_id:
             raise ValueError("project_id is required for creating a version")
         
-        return self.make_request('POST', f'projects/{project_id}/versions.json', 
-                               data={'version': version_data})
+        result = self.make_request('POST', f'projects/{project_id}/versions.json', 
+                                 data={'version': version_data})
+        self._invalidate_versions()
+        return result
     
     def update_version(self, version_id: int, version_data: Dict) -> Dict:
         """
@@ -65,8 +79,10 @@ class VersionClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('PUT', f'versions/{version_id}.json', 
-                               data={'version': version_data})
+        result = self.make_request('PUT', f'versions/{version_id}.json', 
+                                 data={'version': version_data})
+        self._invalidate_versions()
+        return result
     
     def delete_version(self, version_id: int) -> Dict:
         """
@@ -78,4 +94,6 @@ class VersionClient(RedmineBaseClient):
         Returns:
             Empty dictionary on success
         """
-        return self.make_request('DELETE', f'versions/{version_id}.json')
+        result = self.make_request('DELETE', f'versions/{version_id}.json')
+        self._invalidate_versions()
+        return result
@@ -13,7 +13,8 @@ class WikiClient(RedmineBaseClient):
     Client for interacting with Redmine wiki functionality
     """
     
-    def __init__(self, base_url: str, api_key: str, logger: Optional[logging.Logger] = None):
+    def __init__(self, base_url: str, api_key: str, logger: Optional[logging.Logger] = None,
+                 connection_manager=None):
         """
         Initialize the WikiClient
         
@@ -21,8 +22,9 @@ class WikiClient(RedmineBaseClient):
             base_url: Base URL of the Redmine instance
             api_key: API key for authentication
             logger: Optional logger instance
+            connection_manager: Optional shared connection manager
         """
-        super().__init__(base_url, api_key, logger)
+        super().__init__(base_url, api_key, logger, connection_manager)
         self.logger = logger or logging.getLogger(__name__)
         self.error_handler = ErrorHandler(self.logger)
     
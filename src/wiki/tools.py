@@ -1,10 +1,12 @@
 """
 Tools for wiki management
 """
-import json
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 
+from ..core.json_utils import dumps as json_dumps
+
 class WikiTools:
     """Provides wiki management functionality as MCP tools"""
     
@@ -29,14 +31,14 @@ class WikiTools:
             try:
                 if not project_id:
                     error = "project_id is required"
-                    local_logger.error(f"MCP tool redmine-list-wiki-pages failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    local_logger.error("MCP tool redmine-list-wiki-pages failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
-                result = wiki_client.list_wiki_pages(project_id)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(wiki_client.list_wiki_pages, project_id)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                local_logger.error(f"Error listing wiki pages: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                local_logger.error("Error listing wiki pages: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         registered_tools.append("redmine-list-wiki-pages")
         
@@ -46,14 +48,14 @@ class WikiTools:
             try:
                 if not project_id or not page_name:
                     error = "project_id and page_name are required"
-                    local_logger.error(f"MCP tool redmine-get-wiki-page failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    local_logger.error("MCP tool redmine-get-wiki-page failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
-                result = wiki_client.get_wiki_page(project_id, page_name, version)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(wiki_client.get_wiki_page, project_id, page_name, version)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                local_logger.error(f"Error getting wiki page: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                local_logger.error("Error getting wiki page: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         registered_tools.append("redmine-get-wiki-page")
         
@@ -64,16 +66,16 @@ class WikiTools:
             try:
                 if not project_id or not page_name or text is None:
                     error = "project_id, page_name, and text are required"
-                    local_logger.error(f"MCP tool redmine-create-wiki-page failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    local_logger.error("MCP tool redmine-create-wiki-page failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
                 # Fix parameter order to match client method (title=page_name, parent_title first, then comments)
-                result = wiki_client.create_wiki_page(project_id, page_name, text, 
+                result = await asyncio.to_thread(wiki_client.create_wiki_page, project_id, page_name, text, 
                                                     parent_title=parent_title, comments=comments)
-                return json.dumps(result, indent=2)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                local_logger.error(f"Error creating wiki page: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                local_logger.error("Error creating wiki page: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         registered_tools.append("redmine-create-wiki-page")
         
@@ -84,15 +86,15 @@ class WikiTools:
             try:
                 if not project_id or not page_name or text is None:
                     error = "project_id, page_name, and text are required"
-                    local_logger.error(f"MCP tool redmine-update-wiki-page failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    local_logger.error("MCP tool redmine-update-wiki-page failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
-                result = wiki_client.update_wiki_page(project_id, page_name, text, 
+                result = await asyncio.to_thread(wiki_client.update_wiki_page, project_id, page_name, text, 
                                                    comments=comments, parent_title=parent_title)
-                return json.dumps(result, indent=2)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                local_logger.error(f"Error updating wiki page: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                local_logger.error("Error updating wiki page: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         registered_tools.append("redmine-update-wiki-page")
         
@@ -102,14 +104,14 @@ class WikiTools:
             try:
                 if not project_id or not page_name:
                     error = "project_id and page_name are required"
-                    local_logger.error(f"MCP tool redmine-delete-wiki-page failed: {error}")
-                    return json.dumps({"error": error}, indent=2)
+                    local_logger.error("MCP tool redmine-delete-wiki-page failed: %s", error)
+                    return json_dumps({"error": error}, indent=True)
                 
-                result = wiki_client.delete_wiki_page(project_id, page_name)
-                return json.dumps(result, indent=2)
+                result = await asyncio.to_thread(wiki_client.delete_wiki_page, project_id, page_name)
+                return json_dumps(result, indent=True)
             except Exception as e:
-                local_logger.error(f"Error deleting wiki page: {e}")
-                return json.dumps({"error": str(e), "success": False}, indent=2)
+                local_logger.error("Error deleting wiki page: %s", e)
+                return json_dumps({"error": str(e), "success": False}, indent=True)
         
         registered_tools.append("redmine-delete-wiki-page")
         
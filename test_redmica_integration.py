@@ -10,13 +10,16 @@ import json
 REDMINE_URL = "http://localhost:3000"
 REDMINE_API_KEY = "1fb3759d9dfe0851c626c4dd312c62fce6f91050"
 
+# Shared session so both checks reuse one keep-alive connection
+session = requests.Session()
+session.headers.update({'X-Redmine-API-Key': REDMINE_API_KEY, 'Content-Type': 'application/json'})
+
 def test_projects_api():
     """Test the projects API endpoint"""
-    headers = {'X-Redmine-API-Key': REDMINE_API_KEY, 'Content-Type': 'application/json'}
     url = f"{REDMINE_URL}/projects.json"
     
     print(f"Testing Projects API: GET {url}")
-    response = requests.get(url, headers=headers)
+    response = session.get(url)
     
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
@@ -29,12 +32,11 @@ def test_projects_api():
 
 def test_search_api():
     """Test the search API endpoint"""
-    headers = {'X-Redmine-API-Key': REDMINE_API_KEY, 'Content-Type': 'application/json'}
     query = "test"
     url = f"{REDMINE_URL}/search.json?q={query}"
     
     print(f"\nTesting Search API: GET {url}")
-    response = requests.get(url, headers=headers)
+    response = session.get(url)
     
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the badge PR cleanup script
+"""
+import json
+import os
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path to access scripts
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from scripts import cleanup_badge_prs
+
+
+class TestClosePRs(unittest.TestCase):
+    """Test batched closing and its per-PR fallback"""
+
+    def test_fallback_comments_only_where_batch_comment_failed(self):
+        """A PR the batch commented on but could not close is not commented on twice"""
+        response = {'data': {'c0': {'clientMutationId': None}, 'p0': None,
+                             'c1': None, 'p1': None}}
+        prs = [{'id': 'PR_a', 'number': 1}, {'id': 'PR_b', 'number': 2}, {'number': 3}]
+
+        def run(cmd, **kwargs):
+            if cmd[:3] == ['gh', 'api', 'graphql']:
+                return Mock(stdout=json.dumps(response), returncode=1)
+            return Mock(returncode=0)
+
+        with patch.object(cleanup_badge_prs.subprocess, 'run', side_effect=run) as mock_run, \
+                patch.object(cleanup_badge_prs, 'log'):
+            results = cleanup_badge_prs.close_prs(prs)
+
+        self.assertEqual(results, [True, True, True])
+        fallback = sorted(call.args[0] for call in mock_run.call_args_list[1:])
+        self.assertEqual(fallback, [
+            ['gh', 'pr', 'close', '1'],
+            ['gh', 'pr', 'close', '2', '--comment', cleanup_badge_prs.CLOSE_COMMENT],
+            ['gh', 'pr', 'close', '3', '--comment', cleanup_badge_prs.CLOSE_COMMENT],
+        ])
+
+
+class TestPRCache(unittest.TestCase):
+    """Test the cached badge PR listing"""
+
+    def test_cache_key_starts_no_subprocess(self):
+        """The repository is identified by the working directory"""
+        with patch.object(cleanup_badge_prs.subprocess, 'run') as mock_run:
+            key = cleanup_badge_prs._cache_key()
+
+        self.assertEqual(key, os.path.realpath(os.getcwd()))
+        mock_run.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
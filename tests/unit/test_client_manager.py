@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ClientManager lifecycle
+"""
+import os
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.config import RedmineConfig
+from src.core.client_manager import ClientManager
+from src.issues import IssueClient
+
+
+class TestClientManager(unittest.TestCase):
+    """Test client creation and shutdown"""
+
+    def setUp(self):
+        self.config = Mock()
+        self.config.redmine = RedmineConfig(
+            url="https://test.redmine.org",
+            api_key="test_key",
+            timeout=12,
+            max_retries=1,
+            retry_delay=0.5
+        )
+        self.client_manager = ClientManager(self.config)
+        self.client_manager.initialize_clients()
+
+    def test_connection_settings_from_config(self):
+        """Every client uses the configured timeout and retry policy"""
+        for client in self.client_manager.get_all_clients().values():
+            cm = client.connection_manager
+            self.assertEqual(cm.timeout, 12)
+            self.assertEqual(cm.max_retries, 1)
+            self.assertEqual(cm.base_delay, 0.5)
+
+    def test_clients_share_one_connection_manager(self):
+        """All clients reuse the manager's session and connection pool"""
+        managers = {id(c.connection_manager)
+                    for c in self.client_manager.get_all_clients().values()}
+        self.assertEqual(managers, {id(self.client_manager.connection_manager)})
+
+    def test_close_closes_shared_session_once(self):
+        """close() releases the shared session and forgets the clients"""
+        with patch('requests.Session.close') as mock_close:
+            self.client_manager.close()
+
+        mock_close.assert_called_once_with()
+        self.assertEqual(self.client_manager.get_all_clients(), {})
+        self.assertIsNone(self.client_manager.connection_manager)
+
+    def test_context_manager_closes_clients(self):
+        with patch('requests.Session.close') as mock_close:
+            with self.client_manager as manager:
+                self.assertIs(manager, self.client_manager)
+            self.assertTrue(mock_close.called)
+        self.assertEqual(self.client_manager.get_all_clients(), {})
+
+    def test_client_context_manager(self):
+        """A standalone client closes the connection manager it created"""
+        client = IssueClient("https://test.redmine.org", "test_key")
+        with patch.object(client.connection_manager, 'close') as mock_close:
+            with client as entered:
+                self.assertIs(entered, client)
+        mock_close.assert_called_once_with()
+
+    def test_shared_client_leaves_session_open(self):
+        client = self.client_manager.get_client('issues')
+        with patch.object(client.connection_manager, 'close') as mock_close:
+            client.close()
+        mock_close.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
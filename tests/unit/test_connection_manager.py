@@ -65,7 +65,7 @@ class TestConnectionManager(unittest.TestCase):
     
     def test_retry_on_connection_error(self):
         """Test retry behavior when connection fails"""
-        with patch.object(self.client.connection_manager.session, 'get') as mock_get:
+        with patch.object(self.client.connection_manager.session, 'request') as mock_get:
             # Set up mock to fail first time, succeed second time
             mock_get.side_effect = [
                 requests.exceptions.ConnectionError("Connection failed"),
@@ -93,7 +93,7 @@ class TestConnectionManager(unittest.TestCase):
     
     def test_max_retries_exhausted(self):
         """Test behavior when max retries are exhausted"""
-        with patch.object(self.client.connection_manager.session, 'get') as mock_get:
+        with patch.object(self.client.connection_manager.session, 'request') as mock_get:
             # Set up mock to always fail with a connection error
             mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
             
@@ -157,5 +157,83 @@ class TestConnectionManager(unittest.TestCase):
         self.assertTrue(cm._is_retryable_error(server_error))
         self.assertTrue(cm._is_retryable_error(rate_limit_error))
 
+
+class TestConnectionManagerOffline(unittest.TestCase):
+    """Connection manager behaviour that needs no live server"""
+    
+    def setUp(self):
+        self.cm = ConnectionManager("https://test.redmine.org", "test_key")
+        self.cm.configure_retry_settings(max_retries=2, base_delay=0)
+    
+    def _response(self, status_code):
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = "https://test.redmine.org/issues.json"
+        return response
+    
+    def test_pooled_adapter_mounted(self):
+        """Both schemes share one pooled adapter"""
+        adapter = self.cm.session.get_adapter("https://test.redmine.org/")
+        self.assertIs(adapter, self.cm.session.get_adapter("http://test.redmine.org/"))
+        self.assertEqual(adapter._pool_maxsize, self.cm.pool_maxsize)
+    
+    def test_environment_resolved_once(self):
+        """Proxy settings are pinned at construction, not looked up per request"""
+        env = {'HTTPS_PROXY': 'http://proxy.local:3128', 'NO_PROXY': ''}
+        with patch.dict(os.environ, env):
+            cm = ConnectionManager("https://test.redmine.org", "test_key")
+        
+        self.assertFalse(cm.session.trust_env)
+        self.assertEqual(cm.session.proxies.get('https'), 'http://proxy.local:3128')
+    
+    def test_default_headers_come_from_session(self):
+        """No per-call header dict is built unless the caller passes one"""
+        with patch.object(self.cm.session, 'request', return_value=self._response(200)) as mock_request:
+            self.cm.make_request('GET', "https://test.redmine.org/issues.json")
+        self.assertNotIn('headers', mock_request.call_args.kwargs)
+
+        prepared = self.cm.session.prepare_request(requests.Request(
+            'POST', "https://test.redmine.org/uploads.json",
+            headers={'Content-Type': None}))
+        self.assertEqual(prepared.headers['X-Redmine-API-Key'], 'test_key')
+        self.assertNotIn('Content-Type', prepared.headers)
+
+    def test_gateway_error_retried_for_get(self):
+        """A 503 on GET is retried and the later success returned"""
+        responses = [self._response(503), self._response(200)]
+        with patch.object(self.cm.session, 'request', side_effect=responses) as mock_get:
+            response = self.cm.make_request('GET', "https://test.redmine.org/issues.json")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get.call_count, 2)
+    
+    def test_gateway_error_not_retried_for_post(self):
+        """A 503 on POST is returned as-is rather than re-sent"""
+        with patch.object(self.cm.session, 'request', return_value=self._response(503)) as mock_post:
+            response = self.cm.make_request('POST', "https://test.redmine.org/issues.json")
+        
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(mock_post.call_args.args[0], 'POST')
+    
+    def test_unsupported_method_rejected_before_sending(self):
+        with patch.object(self.cm.session, 'request') as mock_request:
+            with self.assertRaises(ValueError):
+                self.cm.make_request('TRACE', "https://test.redmine.org/issues.json")
+        mock_request.assert_not_called()
+    
+    def test_failed_health_check_expires_quickly(self):
+        """A failed probe is cached for the short failure interval only"""
+        failing = requests.exceptions.ConnectionError("down")
+        with patch.object(self.cm.session, 'get', side_effect=failing) as mock_get, \
+                patch('src.connection_manager.time') as mock_time:
+            mock_time.time.side_effect = [1000, 1005, 1020]
+            self.assertFalse(self.cm.health_check())  # probes
+            self.assertFalse(self.cm.health_check())  # cached
+            self.assertFalse(self.cm.health_check())  # failure interval elapsed
+        
+        self.assertEqual(mock_get.call_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Unit tests for GroupClient membership operations
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.groups import GroupClient
+
+
+class TestGroupMembership(unittest.TestCase):
+    """Test adding and removing group members"""
+
+    def setUp(self):
+        self.client = GroupClient("https://test.redmine.org", "test_key")
+
+    def test_remove_user_path(self):
+        with patch.object(self.client, 'make_request', return_value={}) as mock_request:
+            self.client.remove_user_from_group(3, 9)
+        mock_request.assert_called_once_with('DELETE', 'groups/3/users/9.json')
+
+    def test_add_users_in_one_request(self):
+        """A batch of users is a single POST with user_ids"""
+        with patch.object(self.client, 'make_request', return_value={}) as mock_request:
+            self.client.add_users_to_group(3, (4, 5, 6))
+        mock_request.assert_called_once_with(
+            'POST', 'groups/3/users.json', data={'user_ids': [4, 5, 6]}
+        )
+
+    def test_add_no_users(self):
+        with patch.object(self.client, 'make_request') as mock_request:
+            self.assertEqual(self.client.add_users_to_group(3, []), {})
+        mock_request.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
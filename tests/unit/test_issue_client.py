@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Unit tests for IssueClient operations that go beyond plain make_request calls
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.issues import IssueClient
+
+
+class TestAddAttachment(unittest.TestCase):
+    """Test attachment uploads go through the shared connection manager"""
+
+    def setUp(self):
+        self.client = IssueClient("https://test.redmine.org", "test_key")
+        fd, self.file_path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(b'attachment body')
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def test_upload_uses_connection_manager_session(self):
+        """Upload is a multipart POST through the pooled session"""
+        upload_response = Mock()
+        upload_response.raise_for_status = Mock()
+        upload_response.json.return_value = {
+            'upload': {'token': 'abc123', 'filename': 'ignored.txt'}
+        }
+
+        with patch.object(self.client.connection_manager, 'make_request',
+                          return_value=upload_response) as mock_request, \
+                patch.object(self.client, 'update_issue',
+                             return_value={'success': True}) as mock_update:
+            result = self.client.add_attachment(42, self.file_path, 'notes')
+
+        self.assertEqual(result, {'success': True})
+        args, kwargs = mock_request.call_args
+        self.assertEqual(args, ('POST', 'https://test.redmine.org/uploads.json'))
+        self.assertEqual(kwargs['headers'], {'Content-Type': None})
+        filename, body = kwargs['files']['file']
+        self.assertEqual(filename, os.path.basename(self.file_path))
+        self.assertEqual(body, b'attachment body')
+
+        mock_update.assert_called_once_with(42, {
+            'uploads': [{
+                'token': 'abc123',
+                'filename': 'ignored.txt',
+                'description': 'notes'
+            }]
+        })
+
+
+class TestRequestEncoding(unittest.TestCase):
+    """Test JSON request and response handling in make_request"""
+
+    def setUp(self):
+        self.client = IssueClient("https://test.redmine.org", "test_key")
+
+    def test_body_sent_as_encoded_json(self):
+        response = Mock(status_code=201, content=b'{"issue":{"id":7}}', headers={})
+        with patch.object(self.client.connection_manager, 'make_request',
+                          return_value=response) as mock_request:
+            result = self.client.create_issue({'project_id': 1, 'subject': 'S'})
+
+        self.assertEqual(result, {'issue': {'id': 7}})
+        kwargs = mock_request.call_args.kwargs
+        self.assertNotIn('json', kwargs)
+        self.assertEqual(json.loads(kwargs['data']),
+                         {'issue': {'project_id': 1, 'subject': 'S'}})
+
+    def test_leading_slash_in_endpoint(self):
+        response = Mock(status_code=200, content=b'{}', headers={})
+        with patch.object(self.client.connection_manager, 'make_request',
+                          return_value=response) as mock_request:
+            self.client.make_request('GET', '/issues.json')
+            self.client.make_request('GET', 'issues.json')
+
+        urls = [c.args[1] for c in mock_request.call_args_list]
+        self.assertEqual(urls, ['https://test.redmine.org/issues.json'] * 2)
+
+    def test_include_params(self):
+        """Include lists are joined; no include means no params at all"""
+        with patch.object(self.client, 'make_request', return_value={}) as mock_request:
+            self.client.get_issue(1, include=['journals', 'watchers'])
+            self.client.get_issue(1)
+
+        params = [c.kwargs['params'] for c in mock_request.call_args_list]
+        self.assertEqual(params, [{'include': 'journals,watchers'}, None])
+
+    def test_error_status_mapped_without_raising(self):
+        """4xx responses become error dicts without raise_for_status()"""
+        response = Mock(status_code=422, content=b'{"errors":["Subject cannot be blank"]}',
+                        text='{"errors":["Subject cannot be blank"]}', headers={})
+        response.json.return_value = {'errors': ['Subject cannot be blank']}
+        with patch.object(self.client.connection_manager, 'make_request',
+                          return_value=response):
+            result = self.client.make_request('POST', 'issues.json', data={'issue': {}})
+
+        self.assertTrue(result['error'])
+        self.assertEqual(result['status_code'], 422)
+        self.assertIn('Subject cannot be blank', result['message'])
+        response.raise_for_status.assert_not_called()
+
+    def test_no_content_not_decoded(self):
+        response = Mock(status_code=204, content=b'', headers={})
+        with patch.object(self.client.connection_manager, 'make_request',
+                          return_value=response), \
+                patch('src.base.json_loads') as mock_loads:
+            result = self.client.make_request('DELETE', 'issues/1.json')
+
+        self.assertEqual(result, {'success': True, 'status_code': 204})
+        mock_loads.assert_not_called()
+
+    def test_unsupported_method_reported_as_validation_error(self):
+        """A rejected method is a 400 validation error, not a JSON parse failure"""
+        with patch.object(self.client.connection_manager.session, 'request') as mock_request:
+            result = self.client.make_request('TRACE', 'issues.json')
+
+        self.assertEqual(result['error_code'], 'VALIDATION_ERROR')
+        self.assertEqual(result['status_code'], 400)
+        self.assertIn('TRACE', result['message'])
+        mock_request.assert_not_called()
+
+
+class TestIterIssues(unittest.TestCase):
+    """Test paginated issue iteration"""
+
+    def setUp(self):
+        self.client = IssueClient("https://test.redmine.org", "test_key")
+
+    def test_pages_until_total_count(self):
+        """Issues from every page are yielded in order"""
+        pages = [
+            {'issues': [{'id': 1}, {'id': 2}], 'total_count': 3},
+            {'issues': [{'id': 3}], 'total_count': 3},
+        ]
+        with patch.object(self.client, 'make_request', side_effect=pages) as mock_request:
+            ids = [issue['id'] for issue in self.client.iter_issues({'project_id': 'p1'}, page_size=2)]
+
+        self.assertEqual(ids, [1, 2, 3])
+        offsets = [c.kwargs['params']['offset'] for c in mock_request.call_args_list]
+        self.assertEqual(offsets, [0, 2])
+        self.assertEqual(mock_request.call_args.kwargs['params']['project_id'], 'p1')
+
+    def test_error_page_raises(self):
+        """A failed page request surfaces as RedmineAPIError"""
+        from src.core.errors import RedmineAPIError
+        with patch.object(self.client, 'make_request',
+                          return_value={'error': True, 'message': 'boom'}):
+            with self.assertRaises(RedmineAPIError):
+                list(self.client.iter_issues())
+
+
+class TestGetAllIssues(unittest.TestCase):
+    """Test fetching every page of a filtered issue list"""
+
+    def setUp(self):
+        self.client = IssueClient("https://test.redmine.org", "test_key")
+
+    def test_remaining_pages_fetched_after_first(self):
+        """total_count from the first page drives the remaining offsets"""
+        def make_request(method, endpoint, params=None):
+            offset = params['offset']
+            ids = range(offset + 1, min(offset + params['limit'], 5) + 1)
+            return {'issues': [{'id': i} for i in ids], 'total_count': 5}
+
+        with patch.object(self.client, 'make_request', side_effect=make_request) as mock_request:
+            issues = self.client.get_all_issues({'project_id': 'p1'}, page_size=2)
+
+        self.assertEqual([issue['id'] for issue in issues], [1, 2, 3, 4, 5])
+        offsets = sorted(c.kwargs['params']['offset'] for c in mock_request.call_args_list)
+        self.assertEqual(offsets, [0, 2, 4])
+
+    def test_error_page_raises(self):
+        from src.core.errors import RedmineAPIError
+        with patch.object(self.client, 'make_request',
+                          return_value={'error': True, 'message': 'boom'}):
+            with self.assertRaises(RedmineAPIError):
+                self.client.get_all_issues()
+
+
+class TestGetIssuesBulk(unittest.TestCase):
+    """Test fetching many issues by ID"""
+
+    def setUp(self):
+        self.client = IssueClient("https://test.redmine.org", "test_key")
+
+    def test_chunks_and_input_order(self):
+        """IDs are split into filtered requests and results follow input order"""
+        def make_request(method, endpoint, params=None):
+            ids = [int(i) for i in params['issue_id'].split(',')]
+            return {'issues': [{'id': i} for i in sorted(ids) if i != 4]}
+
+        with patch.object(self.client, 'make_request', side_effect=make_request) as mock_request:
+            issues = self.client.get_issues_bulk([5, 3, 4, 1, 3], chunk_size=2)
+
+        self.assertEqual([issue['id'] for issue in issues], [5, 3, 1])
+        self.assertEqual(mock_request.call_count, 2)
+        params = [c.kwargs['params'] for c in mock_request.call_args_list]
+        self.assertEqual(sorted(p['issue_id'] for p in params), ['4,1', '5,3'])
+        self.assertTrue(all(p['status_id'] == '*' for p in params))
+
+    def test_error_chunk_raises(self):
+        from src.core.errors import RedmineAPIError
+        with patch.object(self.client, 'make_request',
+                          return_value={'error': True, 'message': 'boom'}):
+            with self.assertRaises(RedmineAPIError):
+                self.client.get_issues_bulk([1])
+
+
+class TestAddNotesBulk(unittest.TestCase):
+    """Test concurrent note addition"""
+
+    def setUp(self):
+        self.client = IssueClient("https://test.redmine.org", "test_key")
+
+    def test_results_in_input_order(self):
+        """Each note becomes one PUT and results keep input order"""
+        with patch.object(self.client, 'update_issue',
+                          side_effect=lambda issue_id, data: {'id': issue_id}) as mock_update:
+            results = self.client.add_notes_bulk([(3, 'a'), (1, 'b'), (2, 'c')])
+
+        self.assertEqual(results, [{'id': 3}, {'id': 1}, {'id': 2}])
+        self.assertEqual(mock_update.call_count, 3)
+        mock_update.assert_any_call(1, {'notes': 'b'})
+
+    def test_empty_input(self):
+        """No notes means no requests"""
+        with patch.object(self.client, 'update_issue') as mock_update:
+            self.assertEqual(self.client.add_notes_bulk([]), [])
+        mock_update.assert_not_called()
+
+
+class TestMetadataCache(unittest.TestCase):
+    """Test cached metadata lookups"""
+
+    TRACKERS = {'trackers': [{'id': 1, 'name': 'Bug'}, {'id': 2, 'name': 'Feature'}]}
+
+    def setUp(self):
+        self.client = IssueClient("https://test.redmine.org", "test_key")
+
+    @staticmethod
+    def _response(status_code=200, etag=None):
+        return Mock(status_code=status_code, headers={'ETag': etag} if etag else {})
+
+    def test_trackers_fetched_once(self):
+        """Repeated lookups reuse the cached tracker list"""
+        with patch.object(self.client, '_request',
+                          return_value=(self.TRACKERS, self._response())) as mock_request:
+            self.assertEqual(self.client.tracker_id_by_name('feature'), 2)
+            self.assertEqual(self.client.tracker_id_by_name('Bug'), 1)
+            self.assertIsNone(self.client.tracker_id_by_name('Epic'))
+
+        mock_request.assert_called_once_with('GET', 'trackers.json', params=None, headers=None)
+
+    def test_callers_get_independent_copies(self):
+        """Changing a returned result does not change the cached one"""
+        with patch.object(self.client, '_request',
+                          return_value=(dict(self.TRACKERS), self._response())):
+            first = self.client.get_trackers()
+            first['trackers'] = []
+            first['extra'] = True
+
+            self.assertEqual(self.client.get_trackers(), self.TRACKERS)
+
+    def test_expired_entry_refetched(self):
+        """Entries older than the TTL are fetched again"""
+        with patch.object(self.client, '_request',
+                          return_value=(self.TRACKERS, self._response())) as mock_request, \
+                patch('src.base.time.monotonic', side_effect=[0, 1000, 1000]):
+            self.client.get_trackers()
+            self.client.get_trackers()
+
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_expired_entry_revalidated_with_etag(self):
+        """A 304 answer to If-None-Match keeps the cached body"""
+        responses = [
+            (self.TRACKERS, self._response(etag='"v1"')),
+            ({'success': True, 'status_code': 304}, self._response(304)),
+        ]
+        with patch.object(self.client, '_request', side_effect=responses) as mock_request, \
+                patch('src.base.time.monotonic', side_effect=[0, 1000, 1000]):
+            self.client.get_trackers()
+            self.assertEqual(self.client.get_trackers(), self.TRACKERS)
+
+        self.assertEqual(mock_request.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+
+    def test_errors_not_cached(self):
+        """Error responses are returned but not stored"""
+        error = {'error': True, 'message': 'boom'}
+        with patch.object(self.client, '_request',
+                          side_effect=[(error, None), (self.TRACKERS, self._response())]) as mock_request:
+            self.assertEqual(self.client.get_trackers(), error)
+            self.assertEqual(self.client.get_trackers(), self.TRACKERS)
+
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_invalidate_by_prefix(self):
+        """invalidate_cache drops only matching entries"""
+        with patch.object(self.client, '_request',
+                          return_value=({}, self._response())) as mock_request:
+            self.client.get_trackers()
+            self.client.get_issue_statuses()
+            self.client.invalidate_cache('trackers')
+            self.client.get_trackers()
+            self.client.get_issue_statuses()
+
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_invalidation_waits_for_cache_lock(self):
+        """Invalidation never walks the shared cache while another thread holds it"""
+        with patch.object(self.client, '_request',
+                          return_value=({}, self._response())):
+            self.client.get_trackers()
+
+        lock = self.client.connection_manager.response_cache_lock
+        with lock:
+            worker = threading.Thread(target=self.client.invalidate_cache, args=('trackers',))
+            worker.start()
+            worker.join(0.1)
+            self.assertTrue(worker.is_alive())
+        worker.join()
+
+        self.assertEqual(self.client.connection_manager.response_cache, {})
+
+
+class TestConcurrentRequests(unittest.TestCase):
+    """Test parallel request fan-out"""
+
+    def setUp(self):
+        self.client = IssueClient("https://test.redmine.org", "test_key")
+
+    def test_results_in_request_order(self):
+        """Responses line up with the requests and kwargs are passed through"""
+        def make_request(method, endpoint, **kwargs):
+            return {'endpoint': endpoint, **kwargs}
+
+        with patch.object(self.client, 'make_request', side_effect=make_request) as mock_request:
+            results = self.client.make_requests_concurrently([
+                ('GET', 'issues/1.json'),
+                ('GET', 'projects/2.json', {'params': {'include': 'trackers'}}),
+            ])
+
+        self.assertEqual(results, [
+            {'endpoint': 'issues/1.json'},
+            {'endpoint': 'projects/2.json', 'params': {'include': 'trackers'}},
+        ])
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_empty_input(self):
+        with patch.object(self.client, 'make_request') as mock_request:
+            self.assertEqual(self.client.make_requests_concurrently([]), [])
+        mock_request.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
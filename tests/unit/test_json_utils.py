@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the JSON helper module
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core import json_utils
+
+
+class TestJsonUtils(unittest.TestCase):
+    """Test loads/dumps with and without orjson"""
+
+    DATA = {"issue": {"id": 1, "subject": "Test", "tags": ["a", "b"]}}
+
+    def _round_trip(self):
+        self.assertEqual(json_utils.loads(json_utils.dumps(self.DATA)), self.DATA)
+        self.assertEqual(json_utils.loads(json_utils.dumps(self.DATA).encode()), self.DATA)
+        pretty = json_utils.dumps(self.DATA, indent=True)
+        self.assertIn('\n  "issue"', pretty)
+        self.assertEqual(json_utils.loads(pretty), self.DATA)
+
+    def test_round_trip(self):
+        """Active backend round-trips str and bytes input"""
+        self._round_trip()
+
+    def test_round_trip_stdlib_fallback(self):
+        """Fallback to the json module behaves the same"""
+        with patch.object(json_utils, 'orjson', None):
+            self._round_trip()
+
+    def test_decode_error_is_value_error(self):
+        """Malformed input raises JSONDecodeError (a ValueError)"""
+        with self.assertRaises(json_utils.JSONDecodeError):
+            json_utils.loads(b'{not json')
+        with self.assertRaises(ValueError):
+            json_utils.loads(b'{not json')
+
+    def test_non_string_keys_fall_back(self):
+        """Inputs orjson rejects are still serialized"""
+        self.assertEqual(json_utils.loads(json_utils.dumps({1: "x"})), {"1": "x"})
+
+
+if __name__ == '__main__':
+    unittest.main()
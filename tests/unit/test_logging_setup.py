@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit tests for centralized logging setup
+"""
+import logging
+import os
+import sys
+import unittest
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core import logging as core_logging
+from src.core.config import LogConfig
+from src.core.logging import setup_logging
+
+
+class TestSetupLogging(unittest.TestCase):
+    """setup_logging can be called repeatedly without stacking handlers"""
+
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved_handlers = self.root.handlers[:]
+        self.saved_level = self.root.level
+        for handler in self.saved_handlers:
+            self.root.removeHandler(handler)
+        core_logging._handler = None
+
+    def tearDown(self):
+        for handler in self.root.handlers[:]:
+            self.root.removeHandler(handler)
+        for handler in self.saved_handlers:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.saved_level)
+        logging.getLogger('redmine_mcp_server').filters.clear()
+        core_logging._handler = None
+
+    def test_repeat_calls_install_one_handler(self):
+        setup_logging(LogConfig(level="INFO", components="issues"))
+        setup_logging(LogConfig(level="DEBUG", components="issues"))
+
+        self.assertEqual(self.root.handlers, [core_logging._handler])
+        self.assertEqual(self.root.level, logging.DEBUG)
+        self.assertNotIsInstance(core_logging._handler.formatter, core_logging.StructuredFormatter)
+        self.assertEqual(len(logging.getLogger('redmine_mcp_server').filters), 1)
+
+    def test_record_attributes_left_alone(self):
+        """Process-wide record settings belong to the embedding application"""
+        flags = (logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+
+        setup_logging(LogConfig(level="INFO"))
+
+        self.assertEqual(
+            (logging.logThreads, logging.logProcesses, logging.logMultiprocessing), flags)
+
+    def test_existing_handlers_kept(self):
+        """An embedding application's handlers are not replaced"""
+        host_handler = logging.NullHandler()
+        self.root.addHandler(host_handler)
+
+        setup_logging(LogConfig(level="INFO"))
+
+        self.assertEqual(self.root.handlers, [host_handler])
+
+    def test_force_replaces_handlers(self):
+        self.root.addHandler(logging.NullHandler())
+
+        setup_logging(LogConfig(level="INFO"), force=True)
+
+        self.assertEqual(self.root.handlers, [core_logging._handler])
+
+
+if __name__ == '__main__':
+    unittest.main()
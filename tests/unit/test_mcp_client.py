@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the stdio MCP client script, run against a fake server
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path to access scripts
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from scripts.mcp_client import MCPServerProcess
+
+# Answers every request with a ~2 KB result; reads one line at a time, so it
+# stops reading stdin whenever its own stdout pipe is full
+ECHO_SERVER = r'''
+import json, sys
+for line in sys.stdin:
+    message = json.loads(line)
+    if "id" in message:
+        result = {"tool": message.get("params", {}).get("name"), "pad": "x" * 2000}
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}) + "\n")
+        sys.stdout.flush()
+'''
+
+
+class TestMCPServerProcess(unittest.TestCase):
+    """Test request pipelining over the server's stdio pipes"""
+
+    def setUp(self):
+        self.server = MCPServerProcess(command=[sys.executable, '-c', ECHO_SERVER],
+                                       read_timeout=10)
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_batch_larger_than_pipe_buffer(self):
+        """Responses are drained while a large batch is still being written"""
+        calls = [(f"tool-{i}", {"pad": "y" * 2000}) for i in range(600)]
+
+        results = self.server.call_tools(calls)
+
+        self.assertEqual(len(results), 600)
+        self.assertEqual([r["tool"] for r in results], [name for name, _ in calls])
+
+    def test_exited_server_is_restarted(self):
+        """A call after the server dies starts a fresh process"""
+        self.assertEqual(self.server.call_tool("first")["tool"], "first")
+        first_process = self.server.process
+        first_process.kill()
+        first_process.wait()
+
+        self.assertEqual(self.server.call_tool("second")["tool"], "second")
+        self.assertIsNot(self.server.process, first_process)
+
+    def test_broken_pipe_returns_error_and_recovers(self):
+        """A server dying mid-call yields an error dict, then a restart"""
+        self.server.start()
+        with patch('scripts.mcp_client.os.write',
+                   side_effect=BrokenPipeError):
+            result = self.server.call_tool("lost")
+
+        self.assertEqual(result["error"], "Server error")
+        self.assertIsNone(self.server.process)
+        self.assertEqual(self.server.call_tool("again")["tool"], "again")
+
+
+if __name__ == '__main__':
+    unittest.main()
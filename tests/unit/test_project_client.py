@@ -122,5 +122,65 @@ class TestProjectClient(unittest.TestCase):
         self.assertIn("trackers", include_result["projects"][0])
 
 
+class TestProjectClientCache(unittest.TestCase):
+    """Project reads are cached briefly and dropped on writes"""
+
+    def setUp(self):
+        self.client = ProjectClient("https://test.redmine.org", "test_key")
+        self.response = Mock(status_code=200, headers={})
+
+    def test_reads_cached_until_write(self):
+        project = {"project": {"id": 1, "name": "Test Project"}}
+        with patch.object(self.client, '_request',
+                          return_value=(project, self.response)) as mock_request, \
+                patch.object(self.client, 'make_request',
+                             return_value={"success": True}) as mock_write:
+            self.client.get_project(1)
+            self.client.get_project(1)
+            self.assertEqual(mock_request.call_count, 1)
+
+            self.client.update_project(1, {"name": "Renamed"})
+            self.client.get_project(1)
+
+        mock_write.assert_called_once()
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_version_write_keeps_project_entry(self):
+        """A version write on the shared connection drops version lists only"""
+        from src.versions import VersionClient
+        versions = VersionClient("https://test.redmine.org", "test_key",
+                                 connection_manager=self.client.connection_manager)
+        with patch.object(self.client, '_request',
+                          return_value=({"project": {"id": 1}}, self.response)) as project_request, \
+                patch.object(versions, '_request',
+                             return_value=({"versions": []}, self.response)) as version_request, \
+                patch.object(versions, 'make_request', return_value={}):
+            self.client.get_project(1)
+            versions.get_versions(1)
+            versions.update_version(5, {"name": "v2"})
+            self.client.get_project(1)
+            versions.get_versions(1)
+
+        self.assertEqual(project_request.call_count, 1)
+        self.assertEqual(version_request.call_count, 2)
+
+
+class TestIterProjects(unittest.TestCase):
+    """Test paginated project iteration"""
+
+    def test_pages_until_total_count(self):
+        client = ProjectClient("https://test.redmine.org", "test_key")
+        pages = [
+            {'projects': [{'id': 1}, {'id': 2}], 'total_count': 3},
+            {'projects': [{'id': 3}], 'total_count': 3},
+        ]
+        with patch.object(client, 'make_request', side_effect=pages) as mock_request:
+            ids = [project['id'] for project in client.iter_projects(page_size=2)]
+
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertEqual(mock_request.call_args.args, ('GET', 'projects.json'))
+        self.assertEqual(mock_request.call_args.kwargs['params'], {'limit': 2, 'offset': 2})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -52,6 +52,12 @@ class TestSearchResultProcessor(unittest.TestCase):
         highlighted = self.processor.highlight_matches(text, ["missing", "absent"])
         self.assertEqual(text, highlighted)
         
+    def test_highlight_does_not_rescan_tags(self):
+        """A term that occurs in the tag name does not match inside earlier tags"""
+        highlighted = self.processor.highlight_matches("search light", ["search", "light"])
+        self.assertEqual(highlighted,
+                         "<highlight>search</highlight> <highlight>light</highlight>")
+        
     def test_extract_excerpt(self):
         """Test excerpt extraction from full text"""
         full_text = "This is a long text about various topics. " * 10
@@ -163,11 +169,10 @@ class TestSearchCache(unittest.TestCase):
         # Should be retrievable immediately
         self.assertEqual(self.cache.get(key), results)
         
-        # Wait for TTL to expire
-        time.sleep(3)
-        
-        # Should now be expired
-        self.assertIsNone(self.cache.get(key))
+        # Move the clock past the TTL instead of sleeping through it
+        with patch('src.services.search_service.time.time', return_value=time.time() + 3):
+            # Should now be expired
+            self.assertIsNone(self.cache.get(key))
         
     def test_cache_size_limit(self):
         """Test cache size limiting"""
@@ -334,5 +339,30 @@ class TestSearchService(unittest.TestCase):
             self.assertEqual(len(results2["results"]), 2)
 
 
+class TestSearchServiceDispatch(unittest.TestCase):
+    """Test how SearchService combines per-content-type searches"""
+    
+    def setUp(self):
+        self.search_service = SearchService(MagicMock(), {})
+        
+    def test_issue_and_wiki_results_merged_in_order(self):
+        """Both searches run and their results are merged issues-first"""
+        issue_hit = {"id": 1, "type": "issue", "title": "Issue hit"}
+        wiki_hit = {"id": "Page", "type": "wiki_page", "title": "Wiki hit"}
+        
+        with patch.object(self.search_service, '_search_issues',
+                          return_value={"results": [issue_hit], "total_count": 1}) as issues, \
+                patch.object(self.search_service, '_search_wiki_pages',
+                             return_value={"results": [wiki_hit], "total_count": 1}) as wiki, \
+                patch.object(self.search_service.result_processor, 'process_results',
+                             side_effect=lambda raw, query, **kwargs: raw):
+            results = self.search_service.search("hit", project_id="demo")
+            
+        issues.assert_called_once_with("hit", project_id="demo")
+        wiki.assert_called_once_with("hit", project_id="demo")
+        self.assertEqual(results["total_count"], 2)
+        self.assertEqual([r["type"] for r in results["results"]], ["issue", "wiki_page"])
+
+
 if __name__ == '__main__':
     unittest.main()
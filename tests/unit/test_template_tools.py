@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for template management tools
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools.template_tools import CreateSubtasksTool, TemplateManager
+from src.tools.simple_template_tool import SimpleTemplateTool
+
+
+PARENT_ISSUE = {
+    'issue': {
+        'id': 10,
+        'subject': 'Parent',
+        'project': {'id': 7},
+        'priority': {'id': 2}
+    }
+}
+
+SUBTASK_TEMPLATE = {
+    'subtasks': [
+        {'subject': 'Design'},
+        {'subject': 'Build', 'tracker_id': 2},
+        {'subject': 'Test', 'assigned_to_id': 5}
+    ]
+}
+
+
+class TestTemplateManager(unittest.TestCase):
+    """Test template loading and rendering"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.manager = TemplateManager(self.tmpdir.name)
+        self.path = os.path.join(self.tmpdir.name, 'bug.json')
+        self._write({'subject': 'Bug: $TITLE', 'fields': {'note': 'by $USER'}, 'priority_id': 2})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, data, mtime_ns=None):
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_render_substitutes_nested_values(self):
+        rendered = self.manager.render_template('bug', {'TITLE': 'Crash', 'USER': 'ann'})
+        self.assertEqual(rendered, {
+            'subject': 'Bug: Crash',
+            'fields': {'note': 'by ann'},
+            'priority_id': 2
+        })
+
+    def test_unchanged_file_is_parsed_once(self):
+        with patch('src.tools.template_tools.json.load', wraps=json.load) as mock_load:
+            self.manager.load_template('bug')
+            self.manager.load_template('bug')
+        self.assertEqual(mock_load.call_count, 1)
+
+    def test_modified_file_is_reloaded(self):
+        self.manager.load_template('bug')
+        self._write({'subject': 'Changed'}, mtime_ns=10**18)
+        self.assertEqual(self.manager.load_template('bug'), {'subject': 'Changed'})
+
+    def test_missing_template(self):
+        with self.assertRaises(ValueError):
+            self.manager.load_template('nope')
+
+
+class TestCreateSubtasksTool(unittest.TestCase):
+    """Test subtask creation from templates"""
+
+    def setUp(self):
+        self.service = Mock()
+        self.service.get_issue.return_value = PARENT_ISSUE
+        self.template_manager = Mock(spec=TemplateManager)
+        self.template_manager.load_template.return_value = SUBTASK_TEMPLATE
+        self.tool = CreateSubtasksTool(self.service, self.template_manager)
+
+    def test_subtasks_created_in_template_order(self):
+        """Results keep template order even when created concurrently"""
+        def create_issue(data):
+            return {'issue': {'id': 100 + len(data['subject']), 'subject': data['subject']}}
+
+        self.service.create_issue.side_effect = create_issue
+
+        result = self.tool.execute({'parent_issue_id': 10})
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['subtasks_created'], 3)
+        self.assertEqual(
+            [s['subject'] for s in result['subtasks']],
+            ['Parent - Design', 'Parent - Build', 'Parent - Test']
+        )
+        payloads = [c.args[0] for c in self.service.create_issue.call_args_list]
+        for payload in payloads:
+            self.assertEqual(payload['project_id'], 7)
+            self.assertEqual(payload['parent_issue_id'], 10)
+            self.assertEqual(payload['priority_id'], 2)
+
+    def test_failed_subtask_is_skipped(self):
+        """A failing create does not abort the remaining subtasks"""
+        def create_issue(data):
+            if data['subject'].endswith('Build'):
+                raise RuntimeError('boom')
+            return {'issue': {'subject': data['subject']}}
+
+        self.service.create_issue.side_effect = create_issue
+
+        result = self.tool.execute({'parent_issue_id': 10})
+
+        self.assertTrue(result['success'])
+        self.assertEqual(
+            [s['subject'] for s in result['subtasks']],
+            ['Parent - Design', 'Parent - Test']
+        )
+
+    def test_missing_parent_id(self):
+        """parent_issue_id is required"""
+        result = self.tool.execute({})
+        self.assertFalse(result['success'])
+        self.service.create_issue.assert_not_called()
+
+
+
+class TestSimpleTemplateTool(unittest.TestCase):
+    """Test issue creation from template issues"""
+
+    def test_prefix_stripped_and_placeholders_replaced(self):
+        service = Mock()
+        service.get_issue.return_value = {'issue': {
+            'subject': 'Template: Bug - Fix [AREA]',
+            'description': 'Broken in [AREA]',
+            'tracker': {'id': 1},
+            'priority': {'id': 2}
+        }}
+        service.create_issue.side_effect = lambda data: {'issue': data}
+
+        result = SimpleTemplateTool(service).execute({
+            'template_id': 3,
+            'replacements': {'AREA': r'C:\\tmp'}
+        })
+
+        self.assertEqual(result['issue']['subject'], r'Fix C:\\tmp')
+        self.assertEqual(result['issue']['description'], r'Broken in C:\\tmp')
+
+
+if __name__ == '__main__':
+    unittest.main()
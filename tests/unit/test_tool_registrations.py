@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests for tool registration behaviour
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from fastmcp import FastMCP
+from src.core.client_manager import ClientManager
+from src.core.tool_registrations import ToolRegistrations
+
+
+class TestIssueToolsOffloadBlockingCalls(unittest.TestCase):
+    """Issue tools must not run blocking client calls on the event loop"""
+
+    def setUp(self):
+        self.mcp = FastMCP("Test")
+        self.issue_client = Mock()
+        self.client_manager = Mock()
+        self.client_manager.get_client.return_value = self.issue_client
+        self.tool_registrations = ToolRegistrations(self.mcp, self.client_manager)
+        self.tool_registrations.register_issue_tools()
+
+    async def _call(self, tool_name, **kwargs):
+        tools = await self.mcp.get_tools()
+        loop_thread = threading.get_ident()
+        return loop_thread, await tools[tool_name].fn(**kwargs)
+
+    def test_get_issue_runs_in_worker_thread(self):
+        """The client call happens on a thread other than the loop's"""
+        call_threads = []
+
+        def get_issue(issue_id):
+            call_threads.append(threading.get_ident())
+            return {"issue": {"id": issue_id}}
+
+        self.issue_client.get_issue.side_effect = get_issue
+
+        loop_thread, result = asyncio.run(self._call("redmine-get-issue", issue_id=5))
+
+        self.assertEqual(json.loads(result), {"issue": {"id": 5}})
+        self.assertEqual(len(call_threads), 1)
+        self.assertNotEqual(call_threads[0], loop_thread)
+
+
+class TestSearchToolRegistration(unittest.TestCase):
+    """The search tool is recorded once, when it is registered"""
+
+    def test_search_registered_at_registration_time(self):
+        mcp = FastMCP("Test")
+        client_manager = Mock()
+        tool_registrations = ToolRegistrations(mcp, client_manager)
+        tool_registrations.search_service = Mock()
+        tool_registrations.search_service.search.return_value = {"results": []}
+
+        tool_registrations.register_search_tools()
+        self.assertEqual(tool_registrations._registered_tools, ["redmine-search"])
+
+        async def call_twice():
+            tools = await mcp.get_tools()
+            await tools["redmine-search"].fn(query="x")
+            await tools["redmine-search"].fn(query="y")
+
+        asyncio.run(call_twice())
+        self.assertEqual(tool_registrations._registered_tools, ["redmine-search"])
+
+
+class TestVersionInfo(unittest.TestCase):
+    """Version info reports the loaded configuration"""
+
+    def test_environment_fields_from_config(self):
+        mcp = FastMCP("Test")
+        client_manager = Mock()
+        client_manager.config.server.mode = "test"
+        client_manager.config.server.transport = "stdio"
+        client_manager.config.logging.level = "DEBUG"
+        client_manager.config.redmine.url = "http://redmine.example"
+        ToolRegistrations(mcp, client_manager).register_admin_tools()
+
+        async def call():
+            tools = await mcp.get_tools()
+            return await tools["redmine-version-info"].fn()
+
+        info = json.loads(asyncio.run(call()))
+        self.assertEqual(info["server_mode"], "test")
+        self.assertEqual(info["log_level"], "DEBUG")
+        self.assertEqual(info["redmine_url"], "https://redmine.example")
+        self.assertEqual(info["transport"], "stdio")
+        self.assertIn("version", info)
+
+
+class TestDryRunRegistration(unittest.TestCase):
+    """Tool definitions can be listed without real clients"""
+
+    def test_all_tools_registered_without_session(self):
+        config = Mock()
+        client_manager = ClientManager(config, dry_run=True)
+        with patch('src.core.client_manager.ConnectionManager') as mock_cm:
+            client_manager.initialize_clients()
+        mock_cm.assert_not_called()
+
+        mcp = FastMCP("Test")
+        registered = ToolRegistrations(mcp, client_manager).register_all_tools()
+
+        tools = asyncio.run(mcp.get_tools())
+        self.assertIn("redmine-create-issue", tools)
+        self.assertEqual(sorted(tools), sorted(registered))
+
+
+if __name__ == '__main__':
+    unittest.main()
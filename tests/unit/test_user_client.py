@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit tests for UserClient lookups
+"""
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.connection_manager import ConnectionManager
+from src.groups import GroupClient
+from src.users import UserClient
+
+
+class TestUserCache(unittest.TestCase):
+    """Test cached user listings"""
+
+    USERS = {'users': [{'id': 1, 'login': 'admin'}], 'total_count': 1}
+
+    def setUp(self):
+        self.client = UserClient("https://test.redmine.org", "test_key")
+
+    def test_repeated_listing_fetched_once(self):
+        with patch.object(self.client, '_request',
+                          return_value=(self.USERS, Mock(status_code=200, headers={}))) as mock_request:
+            self.client.get_users({'status': 1})
+            self.assertEqual(self.client.get_users({'status': 1}), self.USERS)
+
+        mock_request.assert_called_once_with('GET', 'users.json', params={'status': 1}, headers=None)
+
+    def test_write_invalidates_listing(self):
+        """Creating a user drops cached user lookups, including the current user"""
+        with patch.object(self.client, '_request',
+                          return_value=(self.USERS, Mock(status_code=200, headers={}))) as mock_request, \
+                patch.object(self.client, 'make_request', return_value={'user': {'id': 2}}):
+            self.client.get_users()
+            self.client.get_current_user()
+            self.client.create_user({'login': 'new'})
+            self.client.get_users()
+            self.client.get_current_user()
+
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_group_membership_write_invalidates_user(self):
+        """A membership change through a GroupClient on the same connection drops cached users"""
+        connection_manager = ConnectionManager("https://test.redmine.org", "test_key")
+        users = UserClient("https://test.redmine.org", "test_key",
+                           connection_manager=connection_manager)
+        groups = GroupClient("https://test.redmine.org", "test_key",
+                             connection_manager=connection_manager)
+        user = {'user': {'id': 9, 'groups': []}}
+
+        with patch.object(users, '_request',
+                          return_value=(user, Mock(status_code=200, headers={}))) as mock_request, \
+                patch.object(groups, 'make_request', return_value={}):
+            users.get_user(9, include=['groups'])
+            users.get_user(9, include=['groups'])
+            groups.add_user_to_group(3, 9)
+            users.get_user(9, include=['groups'])
+
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_membership_write_waits_for_cache_lock(self):
+        """Group write invalidation holds off while another thread owns the shared cache"""
+        connection_manager = ConnectionManager("https://test.redmine.org", "test_key")
+        users = UserClient("https://test.redmine.org", "test_key",
+                           connection_manager=connection_manager)
+        groups = GroupClient("https://test.redmine.org", "test_key",
+                             connection_manager=connection_manager)
+
+        with patch.object(users, '_request',
+                          return_value=({'user': {'id': 9}}, Mock(status_code=200, headers={}))), \
+                patch.object(groups, 'make_request', return_value={}):
+            users.get_user(9, include=['groups'])
+            writer = threading.Thread(target=groups.add_user_to_group, args=(3, 9))
+            with connection_manager.response_cache_lock:
+                writer.start()
+                writer.join(0.2)
+                self.assertTrue(writer.is_alive())
+                self.assertTrue(any(key.startswith('users') for key in connection_manager.response_cache))
+            writer.join(5)
+
+        self.assertFalse(writer.is_alive())
+        self.assertFalse(any(key.startswith('users') for key in connection_manager.response_cache))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -326,6 +326,18 @@ class TestStandardizedErrorHandling(unittest.TestCase):
         self.assertEqual(result["error_code"], "TIMEOUT_ERROR")
         self.assertIn("timed out", result["message"])
         self.assertEqual(result["status_code"], 504)
+    
+    def test_unexpected_error_traceback_logged_once(self):
+        """Test that an unexpected error attaches its traceback to one record only"""
+        self.base_client.logger.setLevel(logging.INFO)
+        with patch.object(self.base_client.connection_manager, 'make_request',
+                          side_effect=RuntimeError("boom")):
+            with self.assertLogs(self.base_client.logger, level="ERROR") as captured:
+                result = self.base_client.make_request("GET", "issues.json")
+        
+        self.assertEqual(result["error_code"], "UNEXPECTED_ERROR")
+        with_trace = [r for r in captured.records if r.exc_info]
+        self.assertEqual(len(with_trace), 1)
 
 
 class TestIntegration(unittest.TestCase):
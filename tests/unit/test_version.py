@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Unit tests for build version lookup
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path to access src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core import version
+
+
+class TestGetGitSha(unittest.TestCase):
+    """Test the cached git version helper"""
+
+    def setUp(self):
+        version.get_git_sha.cache_clear()
+
+    def tearDown(self):
+        version.get_git_sha.cache_clear()
+
+    def test_env_var_skips_subprocess(self):
+        with patch.dict(os.environ, {'GIT_COMMIT': 'abc1234'}), \
+                patch('src.core.version.subprocess.check_output') as mock_git:
+            self.assertEqual(version.get_git_sha(), 'abc1234')
+        mock_git.assert_not_called()
+
+    def test_git_called_once(self):
+        env = {k: v for k, v in os.environ.items() if k != 'GIT_COMMIT'}
+        with patch.dict(os.environ, env, clear=True), \
+                patch('src.core.version.subprocess.check_output',
+                      return_value=b'deadbee\n') as mock_git:
+            self.assertEqual(version.get_git_sha(), 'deadbee')
+            self.assertEqual(version.get_git_sha(), 'deadbee')
+        mock_git.assert_called_once()
+
+    def test_git_unavailable(self):
+        env = {k: v for k, v in os.environ.items() if k != 'GIT_COMMIT'}
+        with patch.dict(os.environ, env, clear=True), \
+                patch('src.core.version.subprocess.check_output',
+                      side_effect=FileNotFoundError):
+            self.assertEqual(version.get_git_sha(), 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()